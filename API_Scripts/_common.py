@@ -0,0 +1,245 @@
+"""
+Helpers shared by the USGS MCS and UN Comtrade data scripts.
+
+JSON (de)serialization, file I/O hints, the on-disk catalog item cache,
+the ScienceBase HTTP session and the rate limiters used by the scripts in
+this directory, which import them as a sibling module.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; the standard library is used instead
+    orjson = None
+
+# Catalog metadata changes rarely; cached items younger than this are used
+# without contacting ScienceBase, older ones are revalidated with their ETag
+CATALOG_CACHE_TTL = 24 * 60 * 60
+
+# Longest pause honoured from ScienceBase rate-limit headers (seconds)
+MAX_RATE_LIMIT_WAIT = 60
+
+
+def dumps_json(obj, indent: bool = False) -> bytes:
+    """
+    Serialize an object to JSON bytes, using orjson when it is installed.
+
+    Args:
+        obj: Object to serialize (non-string dict keys are stringified)
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def loads_json(data: bytes | str):
+    """Parse JSON bytes or text, using orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def advise_sequential(f) -> None:
+    """Hint the kernel that an open file will be accessed sequentially."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def drop_page_cache(filepath: Path) -> None:
+    """
+    Hint the kernel to evict a file from the page cache.
+
+    Keeps large downloads from crowding out other workloads' cached pages.
+    No-op on platforms without posix_fadvise.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+class JsonCache:
+    """On-disk cache of JSON entries (e.g. catalog items), one file per key."""
+
+    def __init__(self, cache_dir: Path, ttl: float = CATALOG_CACHE_TTL):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory holding the entries (created on first write)
+            ttl: Seconds an entry is considered fresh after it was written
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    def read(self, key: str) -> tuple[dict, bool]:
+        """
+        Read an entry.
+
+        Returns:
+            Tuple of (cache entry or empty dict, whether the entry is still fresh)
+        """
+        cache_file = self.cache_dir / f"{key}.json"
+        try:
+            entry = loads_json(cache_file.read_bytes())
+            fresh = time.time() - cache_file.stat().st_mtime < self.ttl
+        except (OSError, ValueError):
+            return {}, False
+        return entry, fresh
+
+    def write(self, key: str, entry: dict) -> None:
+        """
+        Atomically write an entry.
+
+        Raises:
+            OSError: If the entry cannot be written
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.cache_dir, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(dumps_json(entry))
+        Path(tmp.name).replace(self.cache_dir / f"{key}.json")
+
+
+def create_sciencebase_session(pool_maxsize: int = 16) -> requests.Session:
+    """
+    Create a keep-alive session for ScienceBase requests.
+
+    Connections are pooled so every call reuses a TCP+TLS connection, and
+    transient failures (429/5xx, dropped connections) are retried with
+    jittered exponential backoff that honours Retry-After, so the happy
+    path never sleeps.
+
+    Args:
+        pool_maxsize: Connections kept open, at least one per worker thread
+
+    Returns:
+        Configured session
+    """
+    session = requests.Session()
+    session.headers.update(
+        {
+            "User-Agent": "Mozilla/5.0 (compatible; CMM-Data-Collector/1.0)",
+            "Connection": "keep-alive",
+            # Compressed transfer for JSON/CSV responses, limited to the
+            # encodings urllib3 can decode in this environment
+            "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+        }
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            backoff_max=30,
+            backoff_jitter=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+class RateLimiter:
+    """Token bucket spacing out API calls made from several threads."""
+
+    def __init__(self, rate: float, burst: float = 1):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Calls allowed per second on average
+            burst: Calls that may start at once after an idle period
+
+        Raises:
+            ValueError: If rate is not positive
+        """
+        if not rate > 0:
+            raise ValueError(f"rate must be positive, got: {rate}")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the next call may start, taking its token."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # The token is taken even if it is not there yet, so later
+            # callers queue up behind this one
+            self._tokens -= 1
+            delay = -self._tokens / self.rate
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ResponseRateLimiter:
+    """
+    Shared pause for requests driven by rate-limit response headers.
+
+    When a response reports the limit is exhausted (``X-RateLimit-Remaining: 0``
+    or a 429), every thread holds its next request until ``X-RateLimit-Reset``
+    or ``Retry-After`` has passed, instead of sleeping a fixed time per call.
+    """
+
+    def __init__(self, max_wait: float = MAX_RATE_LIMIT_WAIT):
+        """
+        Initialize limiter.
+
+        Args:
+            max_wait: Longest pause honoured from a single response (seconds)
+        """
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self) -> None:
+        """Block until the current rate-limit window, if any, has reset."""
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, response: requests.Response) -> None:
+        """Record the rate-limit state reported by a response."""
+        headers = response.headers
+        if response.status_code != 429 and headers.get("X-RateLimit-Remaining") != "0":
+            return
+        reset = headers.get("X-RateLimit-Reset") or headers.get("Retry-After")
+        try:
+            delay = float(reset)
+        except (TypeError, ValueError):
+            return
+        # X-RateLimit-Reset may be an epoch timestamp rather than a delay
+        now = time.time()
+        if delay > now:
+            delay -= now
+        delay = min(max(delay, 0.0), self.max_wait)
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
@@ -9,13 +9,30 @@ Based on: https://www.sciencebase.gov/catalog/item/65a6e45fd34e5af967a46749
 
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pandas as pd
 import requests
+from _common import (
+    JsonCache,
+    advise_sequential,
+    create_sciencebase_session,
+    drop_page_cache,
+    dumps_json,
+    loads_json,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 # CMM Commodities mapping to USGS file name patterns
 # USGS files use format: mcs{year}-{commodity_abbrev}_salient.csv
@@ -37,6 +54,20 @@ CMM_COMMODITY_MAPPING = {
     "Tungsten": ["tungsten", "tungs"],
 }
 
+# Inverted index: lowercased filename pattern -> CMM categories it indicates
+PATTERN_TO_CATEGORIES: dict[str, list[str]] = {}
+for _category, _patterns in CMM_COMMODITY_MAPPING.items():
+    for _pattern in _patterns:
+        PATTERN_TO_CATEGORIES.setdefault(_pattern.lower(), []).append(_category)
+
+# One compiled alternation over every pattern (longest first), with a named
+# group per pattern so each match maps straight back to its categories
+_ORDERED_PATTERNS = sorted(PATTERN_TO_CATEGORIES, key=len, reverse=True)
+COMMODITY_PATTERN_RE = re.compile(
+    "|".join(f"(?P<p{i}>{re.escape(p)})" for i, p in enumerate(_ORDERED_PATTERNS))
+)
+GROUP_TO_CATEGORIES = {f"p{i}": PATTERN_TO_CATEGORIES[p] for i, p in enumerate(_ORDERED_PATTERNS)}
+
 # ScienceBase catalog item IDs for each year
 # Format: https://www.sciencebase.gov/catalog/item/{ITEM_ID}
 SCIENCEBASE_ITEMS = {
@@ -50,34 +81,177 @@ SCIENCEBASE_ITEMS = {
 # Alternative: Direct download URLs if available
 # USGS often provides direct links to zip files
 
+# Number of years downloaded concurrently (downloads are network-bound)
+DEFAULT_MAX_WORKERS = 5
+
+# Buffer size for streaming downloads and zip entries to disk
+COPY_BUFFER_SIZE = 1 << 20
+
+# Number of threads copying matched CSVs into cmm_extracted (I/O-bound)
+EXTRACT_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Written into an extraction directory with the SHA-256 of its source zip
+EXTRACTED_MARKER = ".source.sha256"
+
+
+def match_cmm_categories(filename: str) -> set[str]:
+    """
+    Find the CMM categories a USGS file name belongs to.
+
+    Args:
+        filename: File name (e.g., "mcs2024-lithi_salient.csv")
+
+    Returns:
+        Set of matching CMM category names (empty if none match)
+    """
+    return {
+        category
+        for match in COMMODITY_PATTERN_RE.finditer(filename.lower())
+        for category in GROUP_TO_CATEGORIES[match.lastgroup]
+    }
+
+
+def iter_csv_files(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield directory entries for CSV files under a directory.
+
+    Walks with os.scandir, filtering on the raw entry name, so no Path
+    object is built for entries that are not CSV files.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        os.DirEntry for each CSV file
+    """
+    if not root.is_dir():
+        return
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                # Follow symlinks: extraction directories link into .store
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif entry.name.endswith(".csv"):
+                    yield entry
+
+
+def sha256_file(filepath: Path) -> str:
+    """
+    Compute the SHA-256 hex digest of a file.
+
+    Uses hashlib.file_digest (Python 3.11+), which hashes from a large
+    internal buffer with OpenSSL's hardware-accelerated SHA-256 when
+    available, and falls back to a chunked read on older versions.
+
+    Args:
+        filepath: File to hash
+
+    Returns:
+        Hex digest string
+    """
+    with open(filepath, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def copy_csv(src: Path, dest: Path, *links: Path) -> int:
+    """
+    Copy a CSV file and count its data rows.
+
+    The CSV is copied byte-for-byte: it is not transformed, so parsing it
+    into a DataFrame would be wasted work.
+
+    Args:
+        src: Source CSV file
+        dest: Destination path
+        *links: Additional destination paths, hard-linked to dest (copied
+            if the filesystem does not support hard links)
+
+    Returns:
+        Number of data rows in the copied file
+    """
+    shutil.copyfile(src, dest)
+    for link in links:
+        link.unlink(missing_ok=True)
+        try:
+            os.link(dest, link)
+        except OSError:
+            shutil.copyfile(dest, link)
+    return count_csv_rows(dest)
+
+
+def count_csv_rows(csv_path: Path) -> int:
+    """
+    Count data rows in a CSV file without parsing it.
+
+    Args:
+        csv_path: Path to CSV file
+
+    Returns:
+        Number of lines after the header row
+    """
+    with open(csv_path, "rb", buffering=COPY_BUFFER_SIZE) as f:
+        lines = sum(1 for _ in f)
+    return max(lines - 1, 0)
+
 
 class USGSMCSDownloader:
     """Download and extract USGS Mineral Commodity Summaries data."""
 
-    def __init__(self, output_dir: str = "usgs_mcs_data"):
+    def __init__(
+        self,
+        output_dir: str = "usgs_mcs_data",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cmm_only: bool = False,
+    ):
         """
         Initialize downloader.
 
         Args:
             output_dir: Directory to save downloaded data
+            max_workers: Maximum number of years downloaded concurrently
+            cmm_only: Only extract CSVs for CMM commodities from downloaded zips
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"User-Agent": "Mozilla/5.0 (compatible; CMM-Data-Collector/1.0)"}
-        )
+        self.max_workers = max_workers
+        self.cmm_only = cmm_only
+        self.cache_dir = self.output_dir / ".sb_cache"
+        self.store_dir = self.output_dir / ".store"
+        # Years download concurrently and may share an archive
+        self._store_lock = threading.Lock()
+        self._item_cache: dict[str, dict] = {}
+        self.catalog_cache = JsonCache(self.cache_dir)
+        self.session = create_sciencebase_session()
 
     def get_sciencebase_item_info(self, item_id: str) -> dict:
         """
         Get information about a ScienceBase catalog item.
 
+        Results are memoized in-process and cached on disk; a stale disk
+        entry is revalidated with its ETag.
+
         Args:
             item_id: ScienceBase catalog item ID
 
         Returns:
             Dictionary with item information including download URLs
         """
+        if item_id in self._item_cache:
+            return self._item_cache[item_id]
+
+        cached, fresh = self.catalog_cache.read(item_id)
+        if fresh:
+            self._item_cache[item_id] = cached["item"]
+            return cached["item"]
+        headers = {"If-None-Match": cached["etag"]} if cached.get("etag") else {}
+
         # Try multiple API endpoints
         api_urls = [
             f"https://www.sciencebase.gov/catalog/item/{item_id}?format=json",
@@ -86,20 +260,52 @@ class USGSMCSDownloader:
 
         for api_url in api_urls:
             try:
-                response = self.session.get(api_url, timeout=30)
-                if response.status_code == 200:
-                    return response.json()
-            except requests.RequestException:
+                response = self.session.get(api_url, headers=headers, timeout=30)
+                if response.status_code == 304:
+                    item = cached["item"]
+                elif response.status_code == 200:
+                    item = loads_json(response.content)
+                else:
+                    continue
+            except (requests.RequestException, ValueError):
                 continue
+            try:
+                self.catalog_cache.write(
+                    item_id, {"etag": response.headers.get("ETag"), "item": item}
+                )
+            except OSError as e:
+                print(f"  Warning: Could not cache catalog item {item_id}: {e}")
+            self._item_cache[item_id] = item
+            return item
 
         # If API fails, return empty dict - we'll use direct download URLs
         print(f"  Note: Could not fetch ScienceBase API for {item_id}, will try direct downloads")
         return {}
 
+    @staticmethod
+    def _meta_path(filepath: Path) -> Path:
+        """Path of the sidecar file holding HTTP validators for a download."""
+        return filepath.with_name(f"{filepath.name}.meta.json")
+
+    def _read_meta(self, filepath: Path) -> dict:
+        """Read the download sidecar for a file, or an empty dict if missing."""
+        try:
+            return loads_json(self._meta_path(filepath).read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def _write_meta(self, filepath: Path, meta: dict) -> None:
+        """Write the download sidecar for a file."""
+        self._meta_path(filepath).write_bytes(dumps_json(meta, indent=True))
+
     def download_file(self, url: str, filepath: Path) -> bool:
         """
         Download a file from URL.
 
+        Re-runs are incremental: a complete earlier download is revalidated
+        with a conditional GET (ETag / Last-Modified) and kept on 304, and a
+        partial one is resumed with a Range request.
+
         Args:
             url: URL to download from
             filepath: Local path to save file
@@ -107,36 +313,202 @@ class USGSMCSDownloader:
         Returns:
             True if successful, False otherwise
         """
+        meta = self._read_meta(filepath)
+        local_size = filepath.stat().st_size if filepath.exists() else 0
+        complete = bool(local_size) and meta.get("complete") and meta.get("size") == local_size
+        if complete and meta.get("sha256") and sha256_file(filepath) != meta["sha256"]:
+            print(f"  ⚠ {filepath.name} failed its integrity check, re-downloading")
+            meta, local_size, complete = {}, 0, False
+
+        # Zips are already compressed, and Range offsets must refer to the
+        # bytes stored on disk, so ask for the file as-is
+        headers = {"Accept-Encoding": "identity"}
+        if complete:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        elif local_size and (meta.get("etag") or meta.get("last_modified")):
+            headers["Range"] = f"bytes={local_size}-"
+            headers["If-Range"] = meta.get("etag") or meta["last_modified"]
+
         try:
             print(f"  Downloading: {filepath.name}")
-            response = self.session.get(url, stream=True, timeout=60)
-            response.raise_for_status()
-
-            with open(filepath, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-            print(f"    ✓ Downloaded {filepath.stat().st_size / 1024:.1f} KB")
+            with self.session.get(url, headers=headers, stream=True, timeout=60) as response:
+                if response.status_code == 304:
+                    print("    ✓ Up to date")
+                    return True
+                if response.status_code == 416:
+                    # Local partial file no longer fits the remote one
+                    self._meta_path(filepath).unlink(missing_ok=True)
+                    filepath.unlink(missing_ok=True)
+                    return self.download_file(url, filepath)
+                response.raise_for_status()
+
+                resumed = response.status_code == 206
+                meta = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "complete": False,
+                }
+                self._write_meta(filepath, meta)
+
+                response.raw.decode_content = True
+                mode = "ab" if resumed else "wb"
+                with open(filepath, mode, buffering=COPY_BUFFER_SIZE) as f:
+                    advise_sequential(f)
+                    shutil.copyfileobj(response.raw, f, length=COPY_BUFFER_SIZE)
+
+            size = filepath.stat().st_size
+            meta.update(size=size, sha256=sha256_file(filepath), complete=True)
+            self._write_meta(filepath, meta)
+            action = f"Resumed from {local_size / 1024:.1f} KB to" if resumed else "Downloaded"
+            print(f"    ✓ {action} {size / 1024:.1f} KB")
             return True
         except (requests.RequestException, OSError) as e:
             print(f"    ✗ Error downloading {url}: {e}")
             return False
 
-    def extract_zip(self, zip_path: Path, extract_to: Path) -> bool:
+    def _exists(self, url: str) -> bool:
+        """
+        Check with a HEAD request whether a non-empty file exists at a URL.
+
+        Servers that do not support HEAD are given the benefit of the doubt.
+        """
+        try:
+            response = self.session.head(
+                url, headers={"Accept-Encoding": "identity"}, timeout=15, allow_redirects=True
+            )
+        except requests.RequestException:
+            return False
+        if response.status_code in (405, 501):
+            return True
+        return response.status_code == 200 and response.headers.get("Content-Length") != "0"
+
+    @staticmethod
+    def _read_marker(directory: Path) -> str | None:
+        """Read the source-archive marker of an extraction directory, if any."""
+        try:
+            return (directory / EXTRACTED_MARKER).read_text().strip()
+        except OSError:
+            return None
+
+    def _extract_members(self, zip_path: Path, extract_to: Path, marker: str, cmm_only: bool):
+        """
+        Stream zip members into a directory and record the source marker.
+
+        Each member is copied through a fixed-size buffer rather than using
+        extractall(), keeping memory flat for large archives. Members that
+        would land outside extract_to are skipped.
+        """
+        extract_to.mkdir(parents=True, exist_ok=True)
+        root = extract_to.resolve()
+        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            for info in zip_ref.infolist():
+                if info.is_dir():
+                    continue
+                if cmm_only:
+                    member_name = info.filename.rsplit("/", 1)[-1]
+                    if not (member_name.endswith(".csv") and match_cmm_categories(member_name)):
+                        continue
+                dest = (extract_to / info.filename).resolve()
+                if root not in dest.parents:
+                    print(f"    ⚠ Skipping unsafe path in archive: {info.filename}")
+                    continue
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                with zip_ref.open(info, "r") as src:
+                    with open(dest, "wb", buffering=COPY_BUFFER_SIZE) as dst:
+                        shutil.copyfileobj(src, dst, length=COPY_BUFFER_SIZE)
+        (extract_to / EXTRACTED_MARKER).write_text(marker)
+
+    @staticmethod
+    def _link_directory(target: Path, link: Path) -> bool:
+        """Point link at target with a relative symlink, replacing an old link."""
+        if link.is_symlink():
+            link.unlink()
+        elif link.exists():
+            return False
+        try:
+            link.symlink_to(os.path.relpath(target, link.parent), target_is_directory=True)
+        except OSError:
+            return False
+        return True
+
+    def extract_zip(
+        self,
+        zip_path: Path,
+        extract_to: Path,
+        cmm_only: bool = False,
+        *,
+        digest: str | None = None,
+    ) -> bool:
         """
         Extract a zip file.
 
+        Archives are extracted once into a content-addressed store,
+        <output_dir>/.store/<sha256>, and extract_to is made a symlink to
+        that directory, so re-runs and years sharing an identical archive
+        reuse the same extraction. Where symlinks are unavailable, or
+        extract_to is already a real directory, the archive is extracted in
+        place; that is skipped when its SHA-256 marker already matches.
+        Store entries are extracted into a temporary directory and moved
+        into place, so concurrent years only wait for each other to check
+        or publish an entry, never for an extraction.
+
         Args:
             zip_path: Path to zip file
             extract_to: Directory to extract to
+            cmm_only: Only extract CSV members whose names match a CMM
+                commodity; other members are never decompressed
+            digest: SHA-256 of the zip file if already known (e.g. from
+                download_file), to avoid hashing it again
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            extract_to.mkdir(exist_ok=True)
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(extract_to)
+            if digest is None:
+                digest = sha256_file(zip_path)
+            marker = f"{digest} cmm-only" if cmm_only else digest
+            # A full extraction also satisfies a CMM-only request
+            accepted = {digest, marker}
+            if self._read_marker(extract_to) in accepted:
+                print(f"    ✓ Already extracted to {extract_to}")
+                return True
+
+            if not extract_to.exists() or extract_to.is_symlink():
+                candidates = [self.store_dir / digest]
+                if cmm_only:
+                    candidates.append(self.store_dir / f"{digest}-cmm-only")
+                with self._store_lock:
+                    store_dir = next(
+                        (c for c in candidates if self._read_marker(c) in accepted), None
+                    )
+                if store_dir is None:
+                    store_dir = candidates[-1]
+                    self.store_dir.mkdir(parents=True, exist_ok=True)
+                    tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.store_dir))
+                    tmp_dir.chmod(0o755)  # mkdtemp creates it private
+                    try:
+                        self._extract_members(zip_path, tmp_dir, marker, cmm_only)
+                        with self._store_lock:
+                            # Another year may have published the same
+                            # archive meanwhile; otherwise replace any
+                            # unfinished entry
+                            if self._read_marker(store_dir) != marker:
+                                if store_dir.exists():
+                                    shutil.rmtree(store_dir)
+                                tmp_dir.replace(store_dir)
+                    finally:
+                        shutil.rmtree(tmp_dir, ignore_errors=True)
+                if self._link_directory(store_dir, extract_to):
+                    drop_page_cache(zip_path)
+                    print(f"    ✓ Extracted to {extract_to} (-> .store/{store_dir.name[:12]}…)")
+                    return True
+
+            self._extract_members(zip_path, extract_to, marker, cmm_only)
+            # The archive is not read again after extraction
+            drop_page_cache(zip_path)
             print(f"    ✓ Extracted to {extract_to}")
             return True
         except (OSError, zipfile.BadZipFile) as e:
@@ -190,7 +562,12 @@ class USGSMCSDownloader:
 
                                 # Extract
                                 extract_dir = year_dir / filename.replace(".zip", "")
-                                if self.extract_zip(zip_path, extract_dir):
+                                if self.extract_zip(
+                                    zip_path,
+                                    extract_dir,
+                                    self.cmm_only,
+                                    digest=self._read_meta(zip_path).get("sha256"),
+                                ):
                                     result["extracted_dirs"].append(str(extract_dir))
 
         # Also try direct download from ScienceBase file service
@@ -204,14 +581,27 @@ class USGSMCSDownloader:
                 f"MCS_{year}_Data.zip",
             ]
 
-            for zip_name in zip_names:
-                url = f"https://www.sciencebase.gov/catalog/file/get/{item_id}?name={zip_name}"
+            urls = [
+                f"https://www.sciencebase.gov/catalog/file/get/{item_id}?name={zip_name}"
+                for zip_name in zip_names
+            ]
+            # Probe all candidates with concurrent HEAD requests so misses
+            # cost one round trip in total and never transfer an error page
+            with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+                found = list(executor.map(self._exists, urls))
+
+            for zip_name, url, exists in zip(zip_names, urls, found):
                 zip_path = year_dir / zip_name
 
-                if self.download_file(url, zip_path):
+                if exists and self.download_file(url, zip_path):
                     result["downloaded_files"].append(str(zip_path))
                     extract_dir = year_dir / zip_name.replace(".zip", "")
-                    if self.extract_zip(zip_path, extract_dir):
+                    if self.extract_zip(
+                        zip_path,
+                        extract_dir,
+                        self.cmm_only,
+                        digest=self._read_meta(zip_path).get("sha256"),
+                    ):
                         result["extracted_dirs"].append(str(extract_dir))
                     break
 
@@ -243,40 +633,70 @@ class USGSMCSDownloader:
 
         extracted = {}
 
-        # Find all CSV files in year directory
-        csv_files = list(year_dir.rglob("*.csv"))
-
-        print(f"Found {len(csv_files)} CSV files")
-
-        # Map USGS commodity names to our CMM categories
+        # Map USGS commodity names to our CMM categories in a single pass
+        # over the CSV files in the year directory
         # USGS files use format: mcs{year}-{commodity_abbrev}_salient.csv
-        for cmm_category, usgs_patterns in CMM_COMMODITY_MAPPING.items():
-            matching_files = []
-
-            for csv_file in csv_files:
-                filename_lower = csv_file.name.lower()
-                # Check if file matches any pattern for this CMM category
-                for pattern in usgs_patterns:
-                    if pattern.lower() in filename_lower:
-                        matching_files.append(csv_file)
-                        break
-
-            if matching_files:
+        matches: dict[str, list[Path]] = {category: [] for category in CMM_COMMODITY_MAPPING}
+        csv_count = 0
+        for entry in iter_csv_files(year_dir):
+            csv_count += 1
+            categories = match_cmm_categories(entry.name)
+            if categories:
+                csv_file = Path(entry.path)
+                for category in categories:
+                    matches[category].append(csv_file)
+
+        print(f"Found {csv_count} CSV files")
+
+        # Copy to CMM directory. Each source file is copied once (REE files
+        # serve both Heavy and Light REE); further categories get hard links
+        # to that copy. The copies are I/O-bound and independent, so run them
+        # on a thread pool and report in category order.
+        jobs = [
+            (
+                cmm_category,
+                csv_file,
+                cmm_dir / f"{cmm_category.lower().replace(' ', '_')}_{csv_file.name}",
+            )
+            for cmm_category, matching_files in matches.items()
+            for csv_file in sorted(matching_files)
+        ]
+        # Files with the same name in different subdirectories map to the
+        # same destination and would be copied over each other concurrently,
+        # so only the first one in path order is extracted
+        sources: dict[Path, Path] = {}
+        unique_jobs = []
+        for job in jobs:
+            _, csv_file, dest_file = job
+            first = sources.setdefault(dest_file, csv_file)
+            if first == csv_file:
+                unique_jobs.append(job)
+            else:
+                print(f"  Warning: Skipping {csv_file}, which has the same name as {first}")
+        jobs = unique_jobs
+
+        destinations: dict[Path, list[Path]] = {}
+        for _, csv_file, dest_file in jobs:
+            destinations.setdefault(csv_file, []).append(dest_file)
+
+        with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as executor:
+            by_source = {
+                src: executor.submit(copy_csv, src, *dests) for src, dests in destinations.items()
+            }
+        futures = [by_source[csv_file] for _, csv_file, _ in jobs]
+
+        current_category = None
+        for (cmm_category, csv_file, dest_file), future in zip(jobs, futures):
+            if cmm_category != current_category:
                 print(f"\n{cmm_category}:")
-                for csv_file in matching_files:
-                    print(f"  Found: {csv_file.name}")
-
-                    # Copy to CMM directory
-                    dest_file = (
-                        cmm_dir / f"{cmm_category.lower().replace(' ', '_')}_{csv_file.name}"
-                    )
-                    try:
-                        df = pd.read_csv(csv_file)
-                        df.to_csv(dest_file, index=False)
-                        extracted[cmm_category] = [*extracted.get(cmm_category, []), str(dest_file)]
-                        print(f"    ✓ Extracted {len(df)} rows")
-                    except (OSError, ValueError) as e:
-                        print(f"    ✗ Error processing {csv_file}: {e}")
+                current_category = cmm_category
+            print(f"  Found: {csv_file.name}")
+            try:
+                rows = future.result()
+                extracted[cmm_category] = [*extracted.get(cmm_category, []), str(dest_file)]
+                print(f"    ✓ Extracted {rows} rows")
+            except OSError as e:
+                print(f"    ✗ Error processing {csv_file}: {e}")
 
         return extracted
 
@@ -301,20 +721,24 @@ class USGSMCSDownloader:
 
         summary = {"download_date": datetime.now().isoformat(), "years": {}, "cmm_extracted": {}}
 
-        for year in years:
-            item_id = SCIENCEBASE_ITEMS.get(year)
-            result = self.download_year_data(year, item_id)
-            summary["years"][year] = result
+        # Years are independent, so download them concurrently; the shared
+        # session's connection pool is thread-safe.
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(years)))) as executor:
+            results = executor.map(
+                lambda year: self.download_year_data(year, SCIENCEBASE_ITEMS.get(year)), years
+            )
+
+            for year, result in zip(years, results):
+                summary["years"][year] = result
 
-            # Extract CMM commodities
-            if result["status"] == "complete":
-                extracted = self.extract_cmm_commodities(year)
-                summary["cmm_extracted"][year] = extracted
+                # Extract CMM commodities
+                if result["status"] == "complete":
+                    extracted = self.extract_cmm_commodities(year)
+                    summary["cmm_extracted"][year] = extracted
 
         # Save summary
         summary_file = self.output_dir / "download_summary.json"
-        with open(summary_file, "w") as f:
-            json.dump(summary, f, indent=2)
+        summary_file.write_bytes(dumps_json(summary, indent=True))
 
         print(f"\n{'=' * 80}")
         print("Download Summary")
@@ -366,9 +790,24 @@ Examples:
         help="List of years to download (default: 2020-2024)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of years to download concurrently (default: {DEFAULT_MAX_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--cmm-only",
+        action="store_true",
+        help="Only extract CMM commodity CSVs from downloaded zips (skips other members)",
+    )
+
     args = parser.parse_args()
 
-    downloader = USGSMCSDownloader(output_dir=args.output_dir)
+    downloader = USGSMCSDownloader(
+        output_dir=args.output_dir, max_workers=args.workers, cmm_only=args.cmm_only
+    )
 
     if args.year:
         # Download single year
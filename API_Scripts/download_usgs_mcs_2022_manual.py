@@ -12,12 +12,24 @@ Usage:
 
 from __future__ import annotations
 
-import json
+import shutil
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import requests
+from _common import (
+    JsonCache,
+    advise_sequential,
+    create_sciencebase_session,
+    drop_page_cache,
+    dumps_json,
+    loads_json,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 # CMM Commodities from methodology (Section 2.2)
 # Map to USGS commodity names and expected catalog item IDs
@@ -41,37 +53,75 @@ COMMODITY_ITEM_IDS = {
     "PALLADIUM": {"item_id": None, "cmm_categories": ["Platinum Group Metals"]},
 }
 
+# Number of commodity items downloaded concurrently (downloads are network-bound)
+DEFAULT_MAX_WORKERS = 6
+
+# Buffer size for streaming downloads to disk
+COPY_BUFFER_SIZE = 1 << 20
+
 
 class USGSMCS2022Downloader:
     """Download individual commodity data from 2022 USGS MCS release."""
 
-    def __init__(self, output_dir: str = "usgs_mcs_data"):
+    def __init__(self, output_dir: str = "usgs_mcs_data", max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Initialize downloader.
 
         Args:
             output_dir: Directory to save downloaded data
+            max_workers: Maximum number of commodity items downloaded concurrently
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"User-Agent": "Mozilla/5.0 (compatible; CMM-Data-Collector/1.0)"}
-        )
+        self.max_workers = max_workers
+        self.cache_dir = self.output_dir / ".sb_cache"
+        self._item_cache: dict[str, dict] = {}
+        self.catalog_cache = JsonCache(self.cache_dir)
+        self.session = create_sciencebase_session()
+
+    def get_catalog_item(self, item_id: str, *, log: Callable[[str], None] = print) -> dict:
+        """
+        Get catalog item information (memoized in-process and on disk).
+
+        Args:
+            item_id: ScienceBase catalog item ID
+            log: Called with each error or warning message (printed by default)
+        """
+        if item_id in self._item_cache:
+            return self._item_cache[item_id]
+
+        cached, fresh = self.catalog_cache.read(item_id)
+        if fresh:
+            self._item_cache[item_id] = cached["item"]
+            return cached["item"]
+        headers = {"If-None-Match": cached["etag"]} if cached.get("etag") else {}
 
-    def get_catalog_item(self, item_id: str) -> dict:
-        """Get catalog item information."""
         url = f"https://www.sciencebase.gov/catalog/item/{item_id}?format=json"
         try:
-            response = self.session.get(url, timeout=30)
-            if response.status_code == 200:
-                return response.json()
-        except requests.RequestException as e:
-            print(f"Error fetching item {item_id}: {e}")
-        return {}
+            response = self.session.get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                item = cached["item"]
+            elif response.status_code == 200:
+                item = loads_json(response.content)
+            else:
+                return {}
+        except (requests.RequestException, ValueError) as e:
+            log(f"Error fetching item {item_id}: {e}")
+            return {}
+        try:
+            self.catalog_cache.write(item_id, {"etag": response.headers.get("ETag"), "item": item})
+        except OSError as e:
+            log(f"  Warning: Could not cache catalog item {item_id}: {e}")
+        self._item_cache[item_id] = item
+        return item
 
     def download_commodity_files(
-        self, item_id: str, commodity_name: str, year: int = 2022
+        self,
+        item_id: str,
+        commodity_name: str,
+        year: int = 2022,
+        *,
+        log: Callable[[str], None] = print,
     ) -> list[Path]:
         """
         Download all CSV files from a commodity catalog item.
@@ -80,13 +130,14 @@ class USGSMCS2022Downloader:
             item_id: ScienceBase catalog item ID
             commodity_name: Name of the commodity
             year: Year of the data
+            log: Called with each progress message (printed by default)
 
         Returns:
             list of downloaded file paths
         """
-        item_info = self.get_catalog_item(item_id)
+        item_info = self.get_catalog_item(item_id, log=log)
         if not item_info:
-            print(f"  ✗ Could not fetch item {item_id}")
+            log(f"  ✗ Could not fetch item {item_id}")
             return []
 
         year_dir = self.output_dir / str(year) / "individual_commodities"
@@ -114,19 +165,20 @@ class USGSMCS2022Downloader:
                     filepath = year_dir / f"{commodity_name.lower().replace(' ', '_')}_{filename}"
 
                     try:
-                        print(f"    Downloading: {filename}")
-                        response = self.session.get(url, stream=True, timeout=60)
-                        response.raise_for_status()
+                        log(f"    Downloading: {filename}")
+                        with self.session.get(url, stream=True, timeout=60) as response:
+                            response.raise_for_status()
 
-                        with open(filepath, "wb") as f:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                f.write(chunk)
+                            response.raw.decode_content = True
+                            with open(filepath, "wb", buffering=COPY_BUFFER_SIZE) as f:
+                                advise_sequential(f)
+                                shutil.copyfileobj(response.raw, f, length=COPY_BUFFER_SIZE)
+                        drop_page_cache(filepath)
 
                         downloaded_files.append(filepath)
-                        print(f"      ✓ Downloaded {filepath.stat().st_size / 1024:.1f} KB")
-                        time.sleep(0.5)  # Rate limiting
+                        log(f"      ✓ Downloaded {filepath.stat().st_size / 1024:.1f} KB")
                     except (requests.RequestException, OSError) as e:
-                        print(f"      ✗ Error: {e}")
+                        log(f"      ✗ Error: {e}")
 
         return downloaded_files
 
@@ -152,15 +204,46 @@ class USGSMCS2022Downloader:
             "status": "incomplete",
         }
 
+        to_download = {}
         for commodity_name, info in commodity_ids.items():
-            item_id = info.get("item_id")
-            if not item_id:
+            if not info.get("item_id"):
                 print(f"\n{commodity_name}: ⚠ No item ID provided - skipping")
                 continue
-
-            print(f"\n{commodity_name} (ID: {item_id}):")
-            files = self.download_commodity_files(item_id, commodity_name, year)
-
+            to_download[commodity_name] = info
+
+        def download(commodity_name: str, info: dict) -> tuple[list[Path], list[str]]:
+            lines = []
+            files = self.download_commodity_files(
+                info["item_id"], commodity_name, year, log=lines.append
+            )
+            return files, lines
+
+        # Commodity items are independent, so fetch them concurrently; the
+        # shared session's connection pool is thread-safe. Each commodity's
+        # progress is buffered and printed in one piece once it is done, so
+        # the output of concurrent downloads does not interleave.
+        downloaded = {}
+        workers = max(1, min(self.max_workers, len(to_download)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(download, commodity_name, info): commodity_name
+                for commodity_name, info in to_download.items()
+            }
+            for future in as_completed(futures):
+                commodity_name = futures[future]
+                files, lines = future.result()
+                downloaded[commodity_name] = files
+                print(f"\n{commodity_name} (ID: {to_download[commodity_name]['item_id']}):")
+                for line in lines:
+                    print(line)
+                if files:
+                    print(f"  ✓ Downloaded {len(files)} files")
+                else:
+                    print("  ✗ No files downloaded")
+
+        # The summary lists commodities in input order
+        for commodity_name, info in to_download.items():
+            files = downloaded[commodity_name]
             if files:
                 cmm_categories = info.get("cmm_categories", [commodity_name])
                 for cmm_cat in cmm_categories:
@@ -169,16 +252,12 @@ class USGSMCS2022Downloader:
                     summary["commodities_downloaded"][cmm_cat].extend([str(f) for f in files])
 
                 summary["total_files"] += len(files)
-                print(f"  ✓ Downloaded {len(files)} files")
-            else:
-                print("  ✗ No files downloaded")
 
         summary["status"] = "complete" if summary["total_files"] > 0 else "failed"
 
         # Save summary
         summary_file = self.output_dir / f"{year}_manual_download_summary.json"
-        with open(summary_file, "w") as f:
-            json.dump(summary, f, indent=2)
+        summary_file.write_bytes(dumps_json(summary, indent=True))
 
         print(f"\n{'=' * 80}")
         print("Download Summary")
@@ -227,12 +306,18 @@ Alternatively, use --item-ids-file to provide a JSON file with item IDs.
 
     parser.add_argument("--year", type=int, default=2022, help="Year (default: 2022)")
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of commodity items to download concurrently (default: {DEFAULT_MAX_WORKERS})",
+    )
+
     args = parser.parse_args()
 
     # Load item IDs
     if args.item_ids_file and Path(args.item_ids_file).exists():
-        with open(args.item_ids_file) as f:
-            commodity_ids = json.load(f)
+        commodity_ids = loads_json(Path(args.item_ids_file).read_bytes())
     else:
         commodity_ids = COMMODITY_ITEM_IDS
 
@@ -249,7 +334,7 @@ Alternatively, use --item-ids-file to provide a JSON file with item IDs.
 
     print(f"Using {provided_ids}/{len(commodity_ids)} commodity item IDs")
 
-    downloader = USGSMCS2022Downloader(output_dir=args.output_dir)
+    downloader = USGSMCS2022Downloader(output_dir=args.output_dir, max_workers=args.workers)
     downloader.download_all_commodities(commodity_ids, year=args.year)
 
 
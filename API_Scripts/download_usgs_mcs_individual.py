@@ -9,12 +9,22 @@ Based on methodology: CMM_LLM_Baseline_Gold_QA_Methodology.md
 
 from __future__ import annotations
 
-import json
+import re
+import shutil
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
 from pathlib import Path
 
 import requests
+from _common import (
+    JsonCache,
+    ResponseRateLimiter,
+    advise_sequential,
+    create_sciencebase_session,
+    dumps_json,
+    loads_json,
+)
 
 # CMM Commodities from methodology (Section 2.2)
 # Priority commodities for CMM supply chain modeling
@@ -55,34 +65,144 @@ USGS_COMMODITY_VARIANTS = {
     "TUNGSTEN": ["TUNGSTEN", "TUNGS"],
 }
 
+# Reverse index: uppercased variant -> USGS commodity it identifies
+VARIANT_TO_COMMODITY: dict[str, str] = {
+    variant.upper(): commodity
+    for commodity in CMM_COMMODITIES
+    for variant in USGS_COMMODITY_VARIANTS.get(commodity, [commodity])
+}
+
+# One compiled alternation over every variant (longest first), so a single
+# pass over a title finds every variant it mentions, including multi-word
+# ones. The lookahead matches at every offset, giving the same result as
+# testing each variant as a substring.
+COMMODITY_VARIANT_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(v) for v in sorted(VARIANT_TO_COMMODITY, key=len, reverse=True))
+    + "))"
+)
+
+# ScienceBase catalog item links embedded in HTML pages
+ITEM_ID_RE = re.compile(r"/catalog/item/([a-f0-9]{24})")
+# Item links with their anchor text, which usually carries the item title
+ITEM_ANCHOR_RE = re.compile(
+    r"<a\b[^>]*?href=[\"'][^\"']*?/catalog/item/([a-f0-9]{24})[\"'][^>]*>(.*?)</a>",
+    re.IGNORECASE | re.DOTALL,
+)
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Most item IDs probed from a catalog page (enough to cover every commodity)
+MAX_HTML_CANDIDATES = 200
+
+# Catalog probes and file downloads are I/O bound, so they run on a thread pool
+DEFAULT_MAX_WORKERS = 16
+
+# Buffer size for streaming downloads to disk
+COPY_BUFFER_SIZE = 1 << 20
+
+
+def scan_candidate_ids(html: str, limit: int = MAX_HTML_CANDIDATES) -> list[str]:
+    """
+    Collect catalog item IDs linked from a page that may be commodity releases.
+
+    IDs are deduplicated in page order while scanning, and the scan stops
+    as soon as ``limit`` candidates are found. An ID is skipped when all of
+    its titled links are clearly unrelated, i.e. none mentions a data
+    release, the Mineral Commodity Summaries or a CMM commodity. IDs with
+    no link text are kept, so nothing is dropped on pages without titles.
+
+    Args:
+        html: Catalog page HTML
+        limit: Maximum number of IDs to return
+
+    Returns:
+        The item IDs worth fetching, in page order
+    """
+    anchor_texts: dict[str, list[str]] = {}
+    for match in ITEM_ANCHOR_RE.finditer(html):
+        text = unescape(HTML_TAG_RE.sub("", match.group(2))).strip().upper()
+        if text:
+            anchor_texts.setdefault(match.group(1), []).append(text)
+
+    def looks_relevant(text: str) -> bool:
+        return (
+            "DATA RELEASE" in text
+            or "MINERAL COMMODITY" in text
+            or COMMODITY_VARIANT_RE.search(text) is not None
+        )
+
+    seen: set[str] = set()
+    candidates: list[str] = []
+    for match in ITEM_ID_RE.finditer(html):
+        item_id = match.group(1)
+        if item_id in seen:
+            continue
+        seen.add(item_id)
+        if item_id in anchor_texts and not any(map(looks_relevant, anchor_texts[item_id])):
+            continue
+        candidates.append(item_id)
+        if len(candidates) >= limit:
+            break
+    return candidates
+
 
 class USGSMCSIndividualDownloader:
     """Download individual commodity data from pre-2023 USGS MCS releases."""
 
-    def __init__(self, output_dir: str = "usgs_mcs_data"):
+    def __init__(self, output_dir: str = "usgs_mcs_data", max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Initialize downloader.
 
         Args:
             output_dir: Directory to save downloaded data
+            max_workers: Maximum number of concurrent catalog requests and downloads
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"User-Agent": "Mozilla/5.0 (compatible; CMM-Data-Collector/1.0)"}
-        )
+        self.max_workers = max_workers
+        self.cache_dir = self.output_dir / ".sb_cache"
+        self.cache_dir.mkdir(exist_ok=True)
+        self._item_cache: dict[str, dict] = {}
+        self.catalog_cache = JsonCache(self.cache_dir)
+        self.session = create_sciencebase_session(pool_maxsize=max(1, max_workers))
+        self.rate_limiter = ResponseRateLimiter()
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the shared session, pausing while ScienceBase is rate limiting."""
+        self.rate_limiter.wait()
+        response = self.session.get(url, **kwargs)
+        self.rate_limiter.update(response)
+        return response
 
     def get_catalog_item(self, item_id: str) -> dict:
-        """Get catalog item information."""
+        """Get catalog item information (memoized in-process and on disk)."""
+        if item_id in self._item_cache:
+            return self._item_cache[item_id]
+
+        cached, fresh = self.catalog_cache.read(item_id)
+        if fresh:
+            self._item_cache[item_id] = cached["item"]
+            return cached["item"]
+        headers = {"If-None-Match": cached["etag"]} if cached.get("etag") else {}
+
         url = f"https://www.sciencebase.gov/catalog/item/{item_id}?format=json"
         try:
-            response = self.session.get(url, timeout=30)
-            if response.status_code == 200:
-                return response.json()
-        except requests.RequestException as e:
+            response = self._get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                item = cached["item"]
+            elif response.status_code == 200:
+                item = loads_json(response.content)
+            else:
+                return {}
+        except (requests.RequestException, ValueError) as e:
             print(f"Error fetching item {item_id}: {e}")
-        return {}
+            return {}
+        try:
+            self.catalog_cache.write(item_id, {"etag": response.headers.get("ETag"), "item": item})
+        except OSError as e:
+            print(f"  Warning: Could not cache catalog item {item_id}: {e}")
+        self._item_cache[item_id] = item
+        return item
 
     def get_child_items(self, parent_id: str) -> list[dict]:
         """Get child items from a parent catalog item."""
@@ -94,39 +214,38 @@ class USGSMCSIndividualDownloader:
 
         for url in urls:
             try:
-                response = self.session.get(url, timeout=30)
+                response = self._get(url, timeout=30)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = loads_json(response.content)
                     if isinstance(data, list):
                         return data
                     elif isinstance(data, dict) and "items" in data:
                         return data["items"]
-            except requests.RequestException:
+            except (requests.RequestException, ValueError):
                 continue
 
         # Alternative: Try to parse HTML page for child item links
         try:
-            import re
-
             html_url = f"https://www.sciencebase.gov/catalog/item/{parent_id}"
-            response = self.session.get(html_url, timeout=30)
+            response = self._get(html_url, timeout=30)
             if response.status_code == 200:
                 html = response.text
                 # Look for child item links in the HTML
                 # ScienceBase often has links like: href="/catalog/item/{id}"
-                item_ids = re.findall(r"/catalog/item/([a-f0-9]{24})", html)
-                # Get info for each found ID (limit to reasonable number)
+                # Get info for each found ID (limit to reasonable number); IDs
+                # whose link text already rules them out are skipped up front
                 children = []
-                unique_ids = list(set(item_ids))
-                print(f"  Found {len(unique_ids)} potential item IDs in HTML, checking...")
-                for item_id in unique_ids[:200]:  # Increased limit to get all commodities
-                    item_info = self.get_catalog_item(item_id)
-                    if item_info and item_info.get("title"):
-                        # Only include items that look like commodity data releases
-                        title = item_info.get("title", "").upper()
-                        if "DATA RELEASE" in title or "MINERAL COMMODITY" in title:
-                            children.append(item_info)
-                    time.sleep(0.1)  # Small delay to avoid rate limiting
+                candidate_ids = scan_candidate_ids(html)
+                print(f"  Found {len(candidate_ids)} potential item IDs in HTML, checking...")
+                # Probes run concurrently
+                workers = max(1, min(self.max_workers, len(candidate_ids)))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for item_info in executor.map(self.get_catalog_item, candidate_ids):
+                        if item_info and item_info.get("title"):
+                            # Only include items that look like commodity data releases
+                            title = item_info.get("title", "").upper()
+                            if "DATA RELEASE" in title or "MINERAL COMMODITY" in title:
+                                children.append(item_info)
                 if children:
                     print(f"  Retrieved {len(children)} child items from HTML parsing")
                     return children
@@ -158,58 +277,79 @@ class USGSMCSIndividualDownloader:
 
         # Map commodities to items
         cmm_items = {}
+        # Stop scanning once every CMM commodity has been located
+        remaining = set(CMM_COMMODITIES)
 
         for child in children:
-            title = child.get("title", "").upper()
+            raw_title = child.get("title", "")
+            title = raw_title.upper()
             item_id = child.get("id")
 
             # Skip non-commodity items
             if not title or "DATA RELEASE" not in title:
                 continue
 
-            # Extract commodity name from title
-            # Format: "Mineral Commodity Summaries 2022 - LITHIUM Data Release"
-            # or "Mineral Commodity Summaries 2022 - RARE EARTHS Data Release"
-            if " - " in title:
-                commodity_part = title.split(" - ")[1].replace(" DATA RELEASE", "").strip()
-            else:
-                commodity_part = title
+            # Title format: "Mineral Commodity Summaries 2022 - LITHIUM Data Release"
+            # or "Mineral Commodity Summaries 2022 - RARE EARTHS Data Release".
+            # The commodity part is a substring of the title, so matching the
+            # variants against the full title covers both.
+            matched = {
+                VARIANT_TO_COMMODITY[m.group(1)] for m in COMMODITY_VARIANT_RE.finditer(title)
+            }
+            if not matched:
+                continue
 
             # Check if this item matches any CMM commodity
             for usgs_commodity, cmm_categories in CMM_COMMODITIES.items():
-                variants = USGS_COMMODITY_VARIANTS.get(usgs_commodity, [usgs_commodity])
-
-                for variant in variants:
-                    variant_upper = variant.upper()
-                    # Match if variant appears in commodity part or full title
-                    if variant_upper in commodity_part or variant_upper in title:
-                        # Found a match
-                        for cmm_cat in cmm_categories:
-                            if cmm_cat not in cmm_items:
-                                cmm_items[cmm_cat] = []
-                            cmm_items[cmm_cat].append(
-                                {
-                                    "id": item_id,
-                                    "title": child.get("title"),
-                                    "usgs_commodity": usgs_commodity,
-                                }
-                            )
-                        print(f"  ✓ {usgs_commodity}: {child.get('title')} (ID: {item_id})")
-                        break
+                if usgs_commodity not in matched:
+                    continue
+                for cmm_cat in cmm_categories:
+                    if cmm_cat not in cmm_items:
+                        cmm_items[cmm_cat] = []
+                    cmm_items[cmm_cat].append(
+                        {
+                            "id": item_id,
+                            "title": raw_title,
+                            "usgs_commodity": usgs_commodity,
+                        }
+                    )
+                print(f"  ✓ {usgs_commodity}: {raw_title} (ID: {item_id})")
+
+            remaining -= matched
+            if not remaining:
+                break
 
         print(
             f"\nFound {len(cmm_items)} CMM categories with {sum(len(v) for v in cmm_items.values())} items"
         )
         return cmm_items
 
-    def download_commodity_item(self, item_id: str, commodity_name: str, year: int) -> list[Path]:
+    @staticmethod
+    def _meta_path(filepath: Path) -> Path:
+        """Path of the sidecar file holding HTTP validators for a download."""
+        return filepath.with_name(f"{filepath.name}.meta.json")
+
+    def _read_meta(self, filepath: Path) -> dict:
+        """Read the download sidecar for a file, or an empty dict if missing."""
+        try:
+            return loads_json(self._meta_path(filepath).read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def _write_meta(self, filepath: Path, meta: dict) -> None:
+        """Write the download sidecar for a file."""
+        self._meta_path(filepath).write_bytes(dumps_json(meta, indent=True))
+
+    def download_commodity_item(
+        self, item_id: str, commodity_name: str, year_dir: Path
+    ) -> list[Path]:
         """
         Download files from an individual commodity catalog item.
 
         Args:
             item_id: ScienceBase catalog item ID
             commodity_name: Name of the commodity
-            year: Year of the data
+            year_dir: Existing directory for the year's commodity files
 
         Returns:
             list of downloaded file paths
@@ -218,9 +358,6 @@ class USGSMCSIndividualDownloader:
         if not item_info:
             return []
 
-        year_dir = self.output_dir / str(year) / "individual_commodities"
-        year_dir.mkdir(parents=True, exist_ok=True)
-
         downloaded_files = []
 
         # Get attached files
@@ -242,18 +379,43 @@ class USGSMCSIndividualDownloader:
                 if filename.endswith(".csv"):
                     filepath = year_dir / f"{commodity_name.lower().replace(' ', '_')}_{filename}"
 
+                    # Revalidate a complete earlier download instead of refetching it
+                    meta = self._read_meta(filepath)
+                    headers = {}
+                    if filepath.exists() and meta.get("size") == filepath.stat().st_size:
+                        if meta.get("etag"):
+                            headers["If-None-Match"] = meta["etag"]
+                        if meta.get("last_modified"):
+                            headers["If-Modified-Since"] = meta["last_modified"]
+
                     try:
                         print(f"    Downloading: {filename}")
-                        response = self.session.get(url, stream=True, timeout=60)
-                        response.raise_for_status()
-
-                        with open(filepath, "wb") as f:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                f.write(chunk)
-
+                        # Closing the response returns its connection to the
+                        # pool even when the body is not fully read
+                        with self._get(url, headers=headers, stream=True, timeout=60) as response:
+                            if response.status_code == 304:
+                                downloaded_files.append(filepath)
+                                print("      ✓ Up to date")
+                                continue
+                            response.raise_for_status()
+
+                            self._meta_path(filepath).unlink(missing_ok=True)
+                            response.raw.decode_content = True
+                            with open(filepath, "wb", buffering=COPY_BUFFER_SIZE) as f:
+                                advise_sequential(f)
+                                shutil.copyfileobj(response.raw, f, length=COPY_BUFFER_SIZE)
+
+                        size = filepath.stat().st_size
+                        self._write_meta(
+                            filepath,
+                            {
+                                "etag": response.headers.get("ETag"),
+                                "last_modified": response.headers.get("Last-Modified"),
+                                "size": size,
+                            },
+                        )
                         downloaded_files.append(filepath)
-                        print(f"      ✓ Downloaded {filepath.stat().st_size / 1024:.1f} KB")
-                        time.sleep(0.5)  # Rate limiting
+                        print(f"      ✓ Downloaded {size / 1024:.1f} KB")
                     except (requests.RequestException, OSError) as e:
                         print(f"      ✗ Error: {e}")
 
@@ -289,13 +451,30 @@ class USGSMCSIndividualDownloader:
             "status": "incomplete",
         }
 
+        # Items shared by several categories (e.g. RARE EARTHS) are fetched once,
+        # and all items across categories download concurrently
+        unique_items = list(
+            dict.fromkeys(
+                (item["id"], item["usgs_commodity"])
+                for items in cmm_items.values()
+                for item in items
+            )
+        )
+        year_dir = self.output_dir / str(year) / "individual_commodities"
+        year_dir.mkdir(parents=True, exist_ok=True)
+        workers = max(1, min(self.max_workers, len(unique_items)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda key: self.download_commodity_item(key[0], key[1], year_dir), unique_items
+            )
+            files_by_item = dict(zip(unique_items, results))
+
         for cmm_category, items in cmm_items.items():
             print(f"\n{cmm_category}:")
             category_files = []
 
             for item in items:
-                files = self.download_commodity_item(item["id"], item["usgs_commodity"], year)
-                category_files.extend(files)
+                category_files.extend(files_by_item[(item["id"], item["usgs_commodity"])])
 
             if category_files:
                 summary["commodities_downloaded"][cmm_category] = {
@@ -347,9 +526,16 @@ Examples:
         help="ScienceBase catalog item ID for the specific year data release",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of concurrent catalog requests and downloads (default: {DEFAULT_MAX_WORKERS})",
+    )
+
     args = parser.parse_args()
 
-    downloader = USGSMCSIndividualDownloader(output_dir=args.output_dir)
+    downloader = USGSMCSIndividualDownloader(output_dir=args.output_dir, max_workers=args.workers)
 
     # Determine which catalog item to use
     if args.release_id:
@@ -382,8 +568,7 @@ Examples:
 
     # Save summary
     summary_file = downloader.output_dir / f"{args.year}_individual_download_summary.json"
-    with open(summary_file, "w") as f:
-        json.dump(summary, f, indent=2)
+    summary_file.write_bytes(dumps_json(summary, indent=True))
 
     print(f"\n{'=' * 80}")
     print("Download Summary")
@@ -7,13 +7,79 @@ Since MCS releases contain 5 years of historical data, we can extract
 
 from __future__ import annotations
 
-import json
+import importlib.util
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pandas as pd
+from _common import dumps_json
 
+# Parse CSVs with pandas' multithreaded Arrow reader when pyarrow is
+# installed (optional speed-up); otherwise use the default C parser
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
 
-def extract_years_from_release(release_year: int, target_years: list[int], output_dir: Path):
+# Each CSV is parsed and filtered independently, so files are spread over processes
+DEFAULT_MAX_WORKERS = os.cpu_count() or 1
+
+
+def _extract_one(
+    csv_file: Path, release_year: int, target_years: list[int], output_dir: Path
+) -> tuple[str, str, dict] | None:
+    """
+    Extract target years from a single release CSV into an existing output_dir.
+
+    Runs in a worker process, so it must stay a module-level function.
+
+    Returns:
+        (commodity, file type, extraction info), or None if the file has no
+        rows for the target years
+    """
+    # Read just the header first so files without a Year column (e.g. world
+    # production tables) are never parsed in full
+    if "Year" not in pd.read_csv(csv_file, nrows=0).columns:
+        return None
+
+    df = pd.read_csv(csv_file, engine=CSV_ENGINE)
+
+    # Filter for target years
+    df_filtered = df[df["Year"].isin(target_years)]
+
+    if df_filtered.empty:
+        return None
+
+    # Determine commodity name from filename
+    filename = csv_file.stem
+    # Remove year prefix if present
+    if filename.startswith(f"mcs{release_year}"):
+        commodity_part = filename.replace(f"mcs{release_year}-", "").split("_")[0]
+    else:
+        commodity_part = filename.split("_")[0]
+
+    # Create output filename
+    file_type = "salient" if "salient" in filename else "world"
+    output_filename = f"{commodity_part}_{file_type}_{release_year}_release.csv"
+
+    output_path = output_dir / output_filename
+    df_filtered.to_csv(output_path, index=False)
+
+    return (
+        commodity_part,
+        file_type,
+        {
+            "file": str(output_path),
+            "rows": len(df_filtered),
+            "years": sorted(df_filtered["Year"].unique().tolist()),
+        },
+    )
+
+
+def extract_years_from_release(
+    release_year: int,
+    target_years: list[int],
+    output_dir: Path,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+):
     """
     Extract data for target years from a release.
 
@@ -21,6 +87,7 @@ def extract_years_from_release(release_year: int, target_years: list[int], outpu
         release_year: Year of the MCS release (e.g., 2022)
         target_years: Years to extract (e.g., [2020, 2021])
         output_dir: Output directory for extracted data
+        max_workers: Maximum number of CSV files processed in parallel
     """
     print(f"\nExtracting {target_years} data from {release_year} release...")
     print("=" * 80)
@@ -41,47 +108,34 @@ def extract_years_from_release(release_year: int, target_years: list[int], outpu
 
     extracted = {}
 
-    for csv_file in csv_files:
-        try:
-            df = pd.read_csv(csv_file)
+    if not csv_files:
+        return extracted
 
-            if "Year" not in df.columns:
+    # Ensure output directory exists
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    workers = max(1, min(max_workers, len(csv_files)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_extract_one, csv_file, release_year, target_years, output_dir)
+            for csv_file in csv_files
+        ]
+        for csv_file, future in zip(csv_files, futures):
+            try:
+                result = future.result()
+            except (OSError, ValueError, KeyError) as e:
+                print(f"  ✗ Error processing {csv_file.name}: {e}")
                 continue
 
-            # Filter for target years
-            df_filtered = df[df["Year"].isin(target_years)].copy()
-
-            if not df_filtered.empty:
-                # Determine commodity name from filename
-                filename = csv_file.stem
-                # Remove year prefix if present
-                if filename.startswith(f"mcs{release_year}"):
-                    commodity_part = filename.replace(f"mcs{release_year}-", "").split("_")[0]
-                else:
-                    commodity_part = filename.split("_")[0]
-
-                # Create output filename
-                file_type = "salient" if "salient" in filename else "world"
-                output_filename = f"{commodity_part}_{file_type}_{release_year}_release.csv"
-
-                # Ensure output directory exists
-                output_dir.mkdir(parents=True, exist_ok=True)
-                output_path = output_dir / output_filename
-                df_filtered.to_csv(output_path, index=False)
-
-                if commodity_part not in extracted:
-                    extracted[commodity_part] = {}
-                extracted[commodity_part][file_type] = {
-                    "file": str(output_path),
-                    "rows": len(df_filtered),
-                    "years": sorted(df_filtered["Year"].unique().tolist()),
-                }
-
-                print(f"  ✓ {commodity_part} {file_type}: {len(df_filtered)} rows")
-
-        except (OSError, ValueError, KeyError) as e:
-            print(f"  ✗ Error processing {csv_file.name}: {e}")
-            continue
+            if result is None:
+                continue
+
+            commodity_part, file_type, info = result
+            if commodity_part not in extracted:
+                extracted[commodity_part] = {}
+            extracted[commodity_part][file_type] = info
+
+            print(f"  ✓ {commodity_part} {file_type}: {info['rows']} rows")
 
     return extracted
 
@@ -108,6 +162,12 @@ def main():
     parser.add_argument(
         "--output-dir", type=str, default="usgs_mcs_data/extracted_years", help="Output directory"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of CSV files processed in parallel (default: {DEFAULT_MAX_WORKERS})",
+    )
 
     args = parser.parse_args()
 
@@ -118,14 +178,13 @@ def main():
 
     for release_year in args.release_years:
         extracted = extract_years_from_release(
-            release_year, args.target_years, output_dir / str(release_year)
+            release_year, args.target_years, output_dir / str(release_year), args.workers
         )
         all_extracted[release_year] = extracted
 
     # Save summary
     summary_file = output_dir / "extraction_summary.json"
-    with open(summary_file, "w") as f:
-        json.dump(all_extracted, f, indent=2)
+    summary_file.write_bytes(dumps_json(all_extracted, indent=True))
 
     print(f"\n{'=' * 80}")
     print("Extraction Summary")
@@ -7,9 +7,16 @@ the catalog item ID for each CMM commodity.
 
 from __future__ import annotations
 
-import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import requests
+from _common import (
+    ResponseRateLimiter,
+    create_sciencebase_session,
+    dumps_json,
+    loads_json,
+)
 
 # CMM commodities we need
 CMM_COMMODITIES_2022 = [
@@ -28,6 +35,14 @@ CMM_COMMODITIES_2022 = [
     "PALLADIUM",
 ]
 
+# Searches are independent, so several run concurrently
+DEFAULT_MAX_WORKERS = 8
+
+# Shared by every search so queries reuse one TCP+TLS connection
+_SESSION = create_sciencebase_session()
+# Shared by every search thread so one exhausted window pauses them all
+_RATE_LIMITER = ResponseRateLimiter()
+
 
 def search_commodity_item(year: int, commodity: str, parent_id: str | None = None) -> dict:
     """
@@ -53,9 +68,11 @@ def search_commodity_item(year: int, commodity: str, parent_id: str | None = Non
             search_url = (
                 f"https://www.sciencebase.gov/catalog/items/query?q={query}&format=json&max=10"
             )
-            response = requests.get(search_url, timeout=30)
+            _RATE_LIMITER.wait()
+            response = _SESSION.get(search_url, timeout=30)
+            _RATE_LIMITER.update(response)
             if response.status_code == 200:
-                data = response.json()
+                data = loads_json(response.content)
                 items = data.get("items", []) if isinstance(data, dict) else data
                 for item in items:
                     title = item.get("title", "").upper()
@@ -66,18 +83,21 @@ def search_commodity_item(year: int, commodity: str, parent_id: str | None = Non
                             "title": item.get("title"),
                             "url": f"https://www.sciencebase.gov/catalog/item/{item.get('id')}",
                         }
-        except requests.RequestException:
+        except (requests.RequestException, ValueError):
             continue
 
     return None
 
 
-def find_all_commodity_items(year: int = 2022) -> dict[str, dict]:
+def find_all_commodity_items(
+    year: int = 2022, max_workers: int = DEFAULT_MAX_WORKERS
+) -> dict[str, dict]:
     """
     Find all CMM commodity item IDs for a given year.
 
     Args:
         year: Year to search for
+        max_workers: Maximum number of concurrent searches
 
     Returns:
         Dictionary mapping commodity names to item info
@@ -87,9 +107,16 @@ def find_all_commodity_items(year: int = 2022) -> dict[str, dict]:
 
     results = {}
 
-    for commodity in CMM_COMMODITIES_2022:
+    workers = max(1, min(max_workers, len(CMM_COMMODITIES_2022)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        found = list(
+            executor.map(
+                lambda commodity: search_commodity_item(year, commodity), CMM_COMMODITIES_2022
+            )
+        )
+
+    for commodity, result in zip(CMM_COMMODITIES_2022, found):
         print(f"\nSearching for {commodity}...")
-        result = search_commodity_item(year, commodity)
         if result:
             results[commodity] = result
             print(f"  ✓ Found: {result['title']}")
@@ -118,8 +145,7 @@ def main():
 
         # Save to file
         output_file = "2022_commodity_item_ids.json"
-        with open(output_file, "w") as f:
-            json.dump(results, f, indent=2)
+        Path(output_file).write_bytes(dumps_json(results, indent=True))
         print(f"\nSaved to: {output_file}")
     else:
         print("\nNo items found. You may need to:")
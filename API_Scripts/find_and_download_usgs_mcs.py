@@ -9,12 +9,24 @@ Based on: https://code.usgs.gov/sas/sdm/sciencebasepy
 
 from __future__ import annotations
 
-import json
+import re
+import shutil
+import string
 import sys
-import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import requests
+from _common import (
+    JsonCache,
+    advise_sequential,
+    create_sciencebase_session,
+    drop_page_cache,
+    dumps_json,
+    loads_json,
+)
 
 try:
     from sciencebasepy import SbSession
@@ -22,6 +34,9 @@ except ImportError:
     print("Error: sciencebasepy not installed. Install with: pip install sciencebasepy")
     sys.exit(1)
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 # CMM Commodities from methodology (Section 2.2)
 CMM_COMMODITIES = {
     "RARE EARTHS": {
@@ -48,86 +63,285 @@ CMM_COMMODITIES = {
     },
 }
 
+# Reverse index from each keyword to the commodities it identifies (a keyword
+# such as PLATINUM-GROUP can belong to more than one commodity)
+KEYWORD_TO_COMMODITIES: dict[str, list[str]] = {}
+for _name, _info in CMM_COMMODITIES.items():
+    for _keyword in _info["keywords"]:
+        KEYWORD_TO_COMMODITIES.setdefault(_keyword, []).append(_name)
+
+# One compiled alternation over every keyword (longest first), so a single
+# pass over a title finds every keyword it mentions. The lookahead matches at
+# every offset, giving the same result as testing each keyword as a substring.
+CMM_KEYWORD_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(k) for k in sorted(KEYWORD_TO_COMMODITIES, key=len, reverse=True))
+    + "))"
+)
+
+# Child item lookups are I/O bound, so they run on a thread pool
+DEFAULT_MAX_WORKERS = 16
+
+# Lowercases commodity names and turns spaces into underscores for filenames
+FILENAME_TABLE = str.maketrans(string.ascii_uppercase + " ", string.ascii_lowercase + "_")
+
+# Commodities downloaded at the same time; each also fetches its own files
+# concurrently, with max_workers file downloads shared between them, so
+# this stays small to remain polite to ScienceBase
+COMMODITY_WORKERS = 4
+
+# Children listed per /catalog/items page when discovering a release's items
+CHILD_PAGE_SIZE = 1000
+
+# Buffer size for streaming downloads to disk
+COPY_BUFFER_SIZE = 1 << 20
+
 
 class USGSMCSAutoDownloader:
     """Automatically find and download CMM commodities using sciencebasepy."""
 
-    def __init__(self, output_dir: str = "usgs_mcs_data"):
+    def __init__(self, output_dir: str = "usgs_mcs_data", max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Initialize downloader.
 
         Args:
             output_dir: Directory to save downloaded data
+            max_workers: Maximum number of concurrent ScienceBase requests
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.cache_dir = self.output_dir / ".sb_cache"
+        self.cache_dir.mkdir(exist_ok=True)
+        self.max_workers = max_workers
+        self._item_cache: dict[str, dict] = {}
+        self.catalog_cache = JsonCache(self.cache_dir)
         self.sb = SbSession()
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"User-Agent": "Mozilla/5.0 (compatible; CMM-Data-Collector/1.0)"}
-        )
+        self.session = create_sciencebase_session(pool_maxsize=2 * max(1, max_workers))
 
-    def find_cmm_commodities(self, release_id: str, year: int) -> dict[str, dict]:
+    def get_item(self, item_id: str, fields: str | None = None) -> dict:
         """
-        Find CMM commodity item IDs from a release catalog.
+        Get a catalog item's JSON (memoized in-process and on disk).
 
         Args:
-            release_id: ScienceBase catalog item ID for the year's data release
-            year: Year (for matching in titles)
+            item_id: ScienceBase catalog item ID
+            fields: Comma-separated fields to request instead of the full item
 
-        Returns:
-            Dictionary mapping commodity names to item info
+        Raises:
+            requests.RequestException: If the request fails
+            ValueError: If the response is not valid JSON
         """
-        print(f"\nFinding CMM commodities in {year} release...")
-        print("=" * 80)
+        # Partial items are cached separately from full ones
+        cache_key = item_id if fields is None else f"{item_id}_{fields.replace(',', '_')}"
+        if cache_key in self._item_cache:
+            return self._item_cache[cache_key]
+
+        cached, fresh = self.catalog_cache.read(cache_key)
+        if fresh:
+            self._item_cache[cache_key] = cached["item"]
+            return cached["item"]
+        headers = {"If-None-Match": cached["etag"]} if cached.get("etag") else {}
+
+        url = f"https://www.sciencebase.gov/catalog/item/{item_id}?format=json"
+        if fields is not None:
+            url += f"&fields={fields}"
+        response = self.session.get(url, headers=headers, timeout=30)
+        if response.status_code == 304:
+            item = cached["item"]
+        else:
+            response.raise_for_status()
+            item = loads_json(response.content)
+        try:
+            self.catalog_cache.write(
+                cache_key, {"etag": response.headers.get("ETag"), "item": item}
+            )
+        except OSError as e:
+            print(f"  Warning: Could not cache catalog item {cache_key}: {e}")
+        self._item_cache[cache_key] = item
+        return item
+
+    def _iter_items(self, child_ids: list[str]) -> Iterator[dict]:
+        """
+        Fetch the ID and title of catalog items concurrently.
 
-        # Get child item IDs
-        print(f"Getting child items from catalog {release_id}...")
-        child_ids = self.sb.get_child_ids(release_id)
-        print(f"Found {len(child_ids)} child items")
+        Only the fields needed to match commodities are requested; matched
+        items are fetched in full when their files are downloaded.
 
-        # Get full item info for each child
-        print("Fetching child item details...")
-        children = []
-        for i, child_id in enumerate(child_ids, 1):
+        Args:
+            child_ids: ScienceBase catalog item IDs
+
+        Yields:
+            The items that could be fetched, in the order of child_ids, as
+            soon as each one (and every item before it) has arrived
+        """
+
+        def fetch(child_id: str) -> dict | None:
             try:
-                child = self.sb.get_item(child_id)
-                children.append(child)
-                if i % 20 == 0:
-                    print(f"  Fetched {i}/{len(child_ids)} items...")
+                return self.get_item(child_id, fields="id,title")
             except (requests.RequestException, ValueError) as e:
                 print(f"  Warning: Error fetching {child_id}: {e}")
-                continue
+                return None
+
+        retrieved = 0
+        workers = max(1, min(self.max_workers, len(child_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for i, item in enumerate(executor.map(fetch, child_ids), 1):
+                if i % 20 == 0:
+                    print(f"  Fetched {i}/{len(child_ids)} items...")
+                if item is not None:
+                    retrieved += 1
+                    yield item
+        print(f"Retrieved {retrieved} child items")
+
+    def _iter_child_listing(self, release_id: str) -> Iterator[dict]:
+        """
+        List a release's child items (ID and title only) page by page.
+
+        Args:
+            release_id: ScienceBase catalog item ID for the year's data release
+
+        Yields:
+            Child items as each page arrives
+
+        Raises:
+            requests.RequestException: If a page request fails
+            ValueError: If a page is not valid JSON
+        """
+        url = "https://www.sciencebase.gov/catalog/items"
+        params = {
+            "parentId": release_id,
+            "fields": "title",
+            "max": CHILD_PAGE_SIZE,
+            "offset": 0,
+            "format": "json",
+        }
+        while url:
+            response = self.session.get(url, params=params, timeout=30)
+            response.raise_for_status()
+            page = loads_json(response.content)
+            yield from page.get("items", [])
+            # The next page's URL already carries every query parameter
+            url = (page.get("nextlink") or {}).get("url")
+            params = None
+
+    def _iter_children(self, release_id: str) -> Iterator[dict]:
+        """
+        Get a release's child items, with at least their ID and title.
+
+        Uses the paged catalog search (a few requests in total) and falls back
+        to fetching every child item individually if the search fails.
+
+        Args:
+            release_id: ScienceBase catalog item ID for the year's data release
+
+        Yields:
+            Child items
+        """
+        try:
+            yield from self._iter_child_listing(release_id)
+            return
+        except (requests.RequestException, ValueError) as e:
+            print(f"  Warning: Catalog search failed ({e}), fetching child items one by one")
+
+        child_ids = self.sb.get_child_ids(release_id)
+        print(f"Found {len(child_ids)} child items")
+        print("Fetching child item details...")
+        yield from self._iter_items(child_ids)
 
-        print(f"Retrieved {len(children)} child items\n")
+    def iter_cmm_commodities(self, release_id: str, year: int) -> Iterator[tuple[str, dict]]:
+        """
+        Find CMM commodity item IDs from a release catalog.
+
+        Commodities are yielded as soon as they are matched, while the
+        remaining child items are still being fetched.
 
-        # Match CMM commodities
-        found = {}
-        for child in children:
+        Args:
+            release_id: ScienceBase catalog item ID for the year's data release
+            year: Year (for matching in titles)
+
+        Yields:
+            (commodity name, item info) for each commodity found
+        """
+        print(f"\nFinding CMM commodities in {year} release...")
+        print("=" * 80)
+
+        # List child items and match CMM commodities against their titles
+        print(f"Getting child items from catalog {release_id}...")
+        found = set()
+        for child in self._iter_children(release_id):
             title = child.get("title", "").upper()
 
             # Check if this is a data release for the correct year
             if str(year) not in title or "DATA RELEASE" not in title:
                 continue
 
-            # Check against CMM commodities
+            # Check against CMM commodities in a single pass over the title
+            matched = {
+                name
+                for m in CMM_KEYWORD_RE.finditer(title)
+                for name in KEYWORD_TO_COMMODITIES[m.group(1)]
+            }
+            if not matched:
+                continue
+
             for commodity_name, info in CMM_COMMODITIES.items():
-                keywords = info["keywords"]
-                for keyword in keywords:
-                    if keyword in title:
-                        # Found a match
-                        if commodity_name not in found:
-                            found[commodity_name] = {
-                                "item_id": child.get("id"),
-                                "title": child.get("title"),
-                                "cmm_categories": info["cmm_categories"],
-                            }
-                            print(f"  ✓ {commodity_name}: {child.get('title')}")
-                            print(f"    ID: {child.get('id')}")
-                        break
+                if commodity_name in matched and commodity_name not in found:
+                    found.add(commodity_name)
+                    print(f"  ✓ {commodity_name}: {child.get('title')}")
+                    print(f"    ID: {child.get('id')}")
+                    yield (
+                        commodity_name,
+                        {
+                            "item_id": child.get("id"),
+                            "title": child.get("title"),
+                            "cmm_categories": info["cmm_categories"],
+                        },
+                    )
 
         print(f"\nFound {len(found)}/{len(CMM_COMMODITIES)} CMM commodities")
-        return found
+
+    def find_cmm_commodities(self, release_id: str, year: int) -> dict[str, dict]:
+        """
+        Find CMM commodity item IDs from a release catalog.
+
+        Args:
+            release_id: ScienceBase catalog item ID for the year's data release
+            year: Year (for matching in titles)
+
+        Returns:
+            Dictionary mapping commodity names to item info
+        """
+        return dict(self.iter_cmm_commodities(release_id, year))
+
+    def _download_csv(self, url: str, filepath: Path) -> bool:
+        """
+        Download one CSV file.
+
+        Args:
+            url: URL to download from
+            filepath: Local path to save file
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            print(f"    Downloading: {filepath.name}")
+            # Closing the response returns its connection to the pool even
+            # when the body is not fully read
+            with self.session.get(url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+
+                response.raw.decode_content = True
+                with open(filepath, "wb", buffering=COPY_BUFFER_SIZE) as f:
+                    advise_sequential(f)
+                    shutil.copyfileobj(response.raw, f, length=COPY_BUFFER_SIZE)
+
+            print(f"      ✓ Downloaded {filepath.stat().st_size / 1024:.1f} KB")
+            # The file is not read again by this script
+            drop_page_cache(filepath)
+            return True
+        except (requests.RequestException, OSError) as e:
+            print(f"      ✗ Error: {e}")
+            return False
 
     def download_commodity_files(self, item_id: str, commodity_name: str, year: int) -> list[Path]:
         """
@@ -141,51 +355,48 @@ class USGSMCSAutoDownloader:
         Returns:
             list of downloaded file paths
         """
-        item_info = self.sb.get_item(item_id)
+        # Cached on disk, so reruns skip this request
+        try:
+            item_info = self.get_item(item_id)
+        except (requests.RequestException, ValueError):
+            item_info = {}
         if not item_info:
             print(f"  ✗ Could not fetch item {item_id}")
             return []
 
         year_dir = self.output_dir / str(year) / "individual_commodities"
+        prefix = f"{commodity_name.translate(FILENAME_TABLE)}_"
+
+        # Collect attached CSV files
+        downloads = []
+        for file_info in item_info.get("files", []):
+            url = (
+                file_info.get("url") or file_info.get("downloadUri") or file_info.get("downloadURL")
+            )
+            if not url:
+                # Try constructing URL
+                filename = file_info.get("name", "")
+                url = f"https://www.sciencebase.gov/catalog/file/get/{item_id}?name={filename}"
+
+            filename = file_info.get("name", url.split("/")[-1].split("?")[0])
+
+            # Only download CSV files
+            if filename.endswith(".csv"):
+                downloads.append((url, year_dir / f"{prefix}{filename}"))
+
+        if not downloads:
+            return []
         year_dir.mkdir(parents=True, exist_ok=True)
 
-        downloaded_files = []
-
-        # Get attached files
-        if "files" in item_info:
-            for file_info in item_info["files"]:
-                url = (
-                    file_info.get("url")
-                    or file_info.get("downloadUri")
-                    or file_info.get("downloadURL")
-                )
-                if not url:
-                    # Try constructing URL
-                    filename = file_info.get("name", "")
-                    url = f"https://www.sciencebase.gov/catalog/file/get/{item_id}?name={filename}"
-
-                filename = file_info.get("name", url.split("/")[-1].split("?")[0])
-
-                # Only download CSV files
-                if filename.endswith(".csv"):
-                    filepath = year_dir / f"{commodity_name.lower().replace(' ', '_')}_{filename}"
-
-                    try:
-                        print(f"    Downloading: {filename}")
-                        response = self.session.get(url, stream=True, timeout=60)
-                        response.raise_for_status()
+        # Download the commodity's files concurrently. Up to
+        # COMMODITY_WORKERS commodities do so at once, so each gets its share
+        # of max_workers, keeping all downloads within the session's
+        # connection pool
+        workers = max(1, min(self.max_workers // COMMODITY_WORKERS, len(downloads)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda d: self._download_csv(*d), downloads))
 
-                        with open(filepath, "wb") as f:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                f.write(chunk)
-
-                        downloaded_files.append(filepath)
-                        print(f"      ✓ Downloaded {filepath.stat().st_size / 1024:.1f} KB")
-                        time.sleep(0.5)  # Rate limiting
-                    except (requests.RequestException, OSError) as e:
-                        print(f"      ✗ Error: {e}")
-
-        return downloaded_files
+        return [filepath for (_, filepath), ok in zip(downloads, results) if ok]
 
     def download_year(self, release_id: str, year: int) -> dict:
         """
@@ -202,8 +413,17 @@ class USGSMCSAutoDownloader:
         print(f"USGS MCS {year} Individual Commodity Data")
         print(f"{'=' * 80}")
 
-        # Find commodities
-        commodities = self.find_cmm_commodities(release_id, year)
+        # Find commodities, handing each one to the download workers as soon
+        # as it is matched so downloads overlap the remaining item lookups
+        # and each other
+        commodities = {}
+        with ThreadPoolExecutor(max_workers=min(COMMODITY_WORKERS, self.max_workers)) as executor:
+            downloads = {}
+            for commodity_name, info in self.iter_cmm_commodities(release_id, year):
+                commodities[commodity_name] = info
+                downloads[commodity_name] = executor.submit(
+                    self.download_commodity_files, info["item_id"], commodity_name, year
+                )
 
         if not commodities:
             print(f"\n⚠ No CMM commodities found for {year}")
@@ -226,28 +446,27 @@ class USGSMCSAutoDownloader:
         print(f"Downloading {len(commodities)} commodities...")
         print(f"{'=' * 80}\n")
 
+        downloaded = defaultdict(list)
         for commodity_name, info in commodities.items():
             print(f"{commodity_name} (ID: {info['item_id']}):")
-            files = self.download_commodity_files(info["item_id"], commodity_name, year)
+            files = downloads[commodity_name].result()
 
             if files:
-                cmm_categories = info["cmm_categories"]
-                for cmm_cat in cmm_categories:
-                    if cmm_cat not in summary["commodities_downloaded"]:
-                        summary["commodities_downloaded"][cmm_cat] = []
-                    summary["commodities_downloaded"][cmm_cat].extend([str(f) for f in files])
+                paths = list(map(str, files))
+                for cmm_cat in info["cmm_categories"]:
+                    downloaded[cmm_cat].extend(paths)
 
                 summary["total_files"] += len(files)
                 print(f"  ✓ Downloaded {len(files)} files\n")
             else:
                 print("  ✗ No files downloaded\n")
 
+        summary["commodities_downloaded"] = dict(downloaded)
         summary["status"] = "complete" if summary["total_files"] > 0 else "failed"
 
         # Save summary
         summary_file = self.output_dir / f"{year}_auto_download_summary.json"
-        with open(summary_file, "w") as f:
-            json.dump(summary, f, indent=2)
+        summary_file.write_bytes(dumps_json(summary, indent=True))
 
         # Save commodity IDs for future reference
         ids_file = self.output_dir / f"{year}_commodity_ids.json"
@@ -255,8 +474,7 @@ class USGSMCSAutoDownloader:
             commodity: {"item_id": info["item_id"], "cmm_categories": info["cmm_categories"]}
             for commodity, info in commodities.items()
         }
-        with open(ids_file, "w") as f:
-            json.dump(ids_data, f, indent=2)
+        ids_file.write_bytes(dumps_json(ids_data, indent=True))
 
         print(f"{'=' * 80}")
         print("Download Summary")
@@ -305,9 +523,16 @@ Examples:
         help="ScienceBase catalog item ID for the year data release",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of concurrent ScienceBase requests (default: {DEFAULT_MAX_WORKERS})",
+    )
+
     args = parser.parse_args()
 
-    downloader = USGSMCSAutoDownloader(output_dir=args.output_dir)
+    downloader = USGSMCSAutoDownloader(output_dir=args.output_dir, max_workers=args.workers)
     downloader.download_year(args.release_id, args.year)
 
 
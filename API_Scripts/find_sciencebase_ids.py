@@ -7,7 +7,17 @@ ScienceBase catalog items for years 2020-2022.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from _common import create_sciencebase_session
+
+# Shared by every search so queries reuse one keep-alive connection
+_SESSION = create_sciencebase_session()
+
+# Successful search results by (query, max_results), so repeated lookups in
+# a session do not hit ScienceBase again. Failed searches are not cached.
+_SEARCH_CACHE: dict[tuple[str, int], list[dict]] = {}
 
 
 def search_sciencebase(query: str, max_results: int = 10) -> list[dict]:
@@ -21,6 +31,10 @@ def search_sciencebase(query: str, max_results: int = 10) -> list[dict]:
     Returns:
         list of item dictionaries
     """
+    cached = _SEARCH_CACHE.get((query, max_results))
+    if cached is not None:
+        return list(cached)
+
     # ScienceBase search endpoint (may vary)
     search_urls = [
         f"https://www.sciencebase.gov/catalog/items/query?q={query}&format=json&max={max_results}",
@@ -29,13 +43,17 @@ def search_sciencebase(query: str, max_results: int = 10) -> list[dict]:
 
     for url in search_urls:
         try:
-            response = requests.get(url, timeout=30)
+            response = _SESSION.get(url, timeout=30)
             if response.status_code == 200:
                 data = response.json()
                 if "items" in data:
-                    return data["items"]
+                    items = data["items"]
                 elif isinstance(data, list):
-                    return data
+                    items = data
+                else:
+                    continue
+                _SEARCH_CACHE[(query, max_results)] = items
+                return list(items)
         except requests.RequestException:
             continue
 
@@ -85,9 +103,12 @@ def main():
     print("Searching for missing years...")
     print("-" * 70)
 
-    for year in missing_years:
+    # Search every year at once; results are printed in year order
+    with ThreadPoolExecutor(max_workers=len(missing_years)) as executor:
+        found_ids = list(executor.map(find_mcs_item_id, missing_years))
+
+    for year, item_id in zip(missing_years, found_ids):
         print(f"\n{year}:")
-        item_id = find_mcs_item_id(year)
         if item_id:
             print(f"  ✓ Found: {item_id}")
             print(f"    URL: https://www.sciencebase.gov/catalog/item/{item_id}")
@@ -10,16 +10,46 @@ Years: 2020-2024 (covers both Stratum A and Stratum B temporal requirements)
 
 from __future__ import annotations
 
-import json
+import hashlib
+import itertools
+import logging
+import pickle
+import queue
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
+from _common import dumps_json
 
 # Import the ComtradeQuery class
-from un_comtrade_query import CMM_HS_CODES, COUNTRY_CODES, ComtradeQuery
+from un_comtrade_query import (
+    CMM_HS_CODES,
+    COUNTRY_CODES,
+    DEFAULT_RATE_LIMIT,
+    RESPONSE_CACHE_TTL,
+    ComtradeQuery,
+    TruncatedResponseError,
+    _parse_rate_limit,
+)
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # optional speed-up; pandas' C parser is used instead
+    pa = pa_csv = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = logging.getLogger(__name__)
 
 # Additional HS codes (some may be in main file, these are for reference)
 # Note: Nickel and Copper codes should be in un_comtrade_query.py
@@ -112,43 +142,121 @@ KEY_COUNTRY_PAIRS = [
 # Years to query (covers both Stratum A and Stratum B requirements)
 YEARS = [2020, 2021, 2022, 2023, 2024]
 
+# UN Comtrade flow codes queried for each trade_flow mode
+FLOWS_BY_MODE = {"both": ("M", "X"), "import": ("M",), "export": ("X",)}
+
+# Query-key columns hold a handful of distinct codes each, so they are loaded
+# as categoricals (a missing column is simply not converted). They are parsed
+# as text, so an HS code with a leading zero keeps it.
+KEY_COLUMNS = ("cmdCode", "reporterCode", "partnerCode", "flowCode")
+
+# API calls are I/O bound, so a few run at once on a thread pool
+DEFAULT_MAX_WORKERS = 4
+
+# Commodities collected at the same time; each also runs its own queries
+# concurrently, and all of them share the client's rate limiter
+COMMODITY_WORKERS = 4
+
 
 class GoldQADataCollector:
     """Collect UN Comtrade data for Gold Q&A methodology requirements."""
 
-    def __init__(self, api_key: str | None = None, output_dir: str = "gold_qa_data"):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        output_dir: str = "gold_qa_data",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache_ttl: float = RESPONSE_CACHE_TTL,
+        rate_limit: float | None = None,
+    ):
         """
         Initialize data collector.
 
         Args:
             api_key: UN Comtrade API key (or set UN_COMTRADE_API_KEY env var)
             output_dir: Directory to save collected data
+            max_workers: Maximum number of concurrent API calls
+            cache_ttl: Seconds an on-disk API response is reused for
+            rate_limit: Most API calls to start per second, shared by all
+                workers (0 for no limit); defaults to ``COMTRADE_RATE`` or 2
         """
-        self.query = ComtradeQuery(api_key=api_key)
+        # The client paces every API call made by the workers; responses are
+        # memoized and cached on disk by the collector itself
+        self.query = ComtradeQuery(api_key=api_key, use_cache=False, rate_limit=rate_limit)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-
-        # Track queries to avoid duplicates
-        self.query_log = []
+        self.max_workers = max_workers
+
+        # API responses (empty ones included, as failed calls raise instead)
+        # are also kept on disk across runs, until they expire (UN Comtrade revises published data, and the current
+        # year is only partially reported)
+        self.cache_dir = self.output_dir / ".comtrade_cache"
+        self.cache_dir.mkdir(exist_ok=True)
+        self.cache_ttl = cache_ttl
+
+        # Query the preview API (set by pull_all_gold_qa_data)
+        self.preview = False
+
+        # API responses (empty ones included) by (hs_code, reporter, partner,
+        # year, flow_code), so commodities sharing HS codes (e.g. Heavy and Light
+        # REE) query each combination only once
+        self._api_cache: dict[tuple[str, str, str, int, str], pd.DataFrame] = {}
+        # Responses being fetched for one commodity, which other commodities
+        # wait for instead of querying the same combination again
+        self._pending: dict[tuple[str, str, str, int, str], Future] = {}
+        self._cache_lock = threading.Lock()
+
+        # UN Comtrade numeric country codes as strings, for existing-data checks
+        self._country_codes = {name: str(code) for name, code in COUNTRY_CODES.items()}
+
+        # Track queries to avoid duplicates, as
+        # (commodity_name, hs_code, reporter, partner, year, flow_code) tuples
+        self.query_log: set[tuple[str, str, str, str, int, str]] = set()
         self.collected_data = {}
 
-    def _load_existing_data(self, commodity_name: str) -> pd.DataFrame:
-        """Load existing data for a commodity if it exists."""
-        filename = f"{commodity_name.lower().replace(' ', '_')}_trade_data.csv"
-        filepath = self.output_dir / filename
+    def _data_file(self, commodity_name: str) -> Path:
+        """Get the path of a commodity's trade data file."""
+        return self.output_dir / f"{commodity_name.lower().replace(' ', '_')}_trade_data.csv"
 
+    def _load_existing_data(self, filepath: Path) -> pd.DataFrame:
+        """Load a commodity's existing trade data if the file exists."""
         if filepath.exists():
             try:
-                df = pd.read_csv(filepath)
-                return df
+                if pa_csv is not None:
+                    # Parsed with pyarrow's multithreaded reader directly, as
+                    # pandas' pyarrow engine infers the key columns as
+                    # integers before applying dtype, dropping leading zeros
+                    options = pa_csv.ConvertOptions(
+                        column_types=dict.fromkeys(KEY_COLUMNS, pa.string())
+                    )
+                    df = pa_csv.read_csv(filepath, convert_options=options).to_pandas()
+                else:
+                    df = pd.read_csv(filepath, dtype=dict.fromkeys(KEY_COLUMNS, str))
+                return df.astype({col: "category" for col in KEY_COLUMNS if col in df})
             except (OSError, ValueError) as e:
-                print(f"  Warning: Could not load existing data: {e}")
+                logger.warning(f"  Warning: Could not load existing data: {e}")
                 return pd.DataFrame()
         return pd.DataFrame()
 
+    @staticmethod
+    def _row_keys(df: pd.DataFrame) -> Iterator[tuple[str, str, str, str, str]]:
+        """
+        Get the query key of every row of trade data.
+
+        Returns:
+            Iterator of (cmdCode, reporterCode, partnerCode, period, flowCode) tuples
+        """
+        return zip(
+            df["cmdCode"].astype(str),
+            df["reporterCode"].astype(str),
+            df["partnerCode"].astype(str),
+            df["period"].astype(str),
+            df["flowCode"],
+        )
+
     def _check_data_exists(
         self,
-        existing_df: pd.DataFrame,
+        existing_keys: set[tuple[str, str, str, str, str]],
         hs_code: str,
         reporter: str,
         partner: str,
@@ -156,23 +264,215 @@ class GoldQADataCollector:
         flow_code: str,
     ) -> bool:
         """Check if data already exists for this specific query."""
-        if existing_df.empty:
-            return False
-
         # Convert country codes
-        reporter_code = COUNTRY_CODES.get(reporter, reporter)
-        partner_code = COUNTRY_CODES.get(partner, partner)
-
-        # Check if we have data for this combination
-        mask = (
-            (existing_df["cmdCode"].astype(str) == str(hs_code))
-            & (existing_df["reporterCode"].astype(str) == str(reporter_code))
-            & (existing_df["partnerCode"].astype(str) == str(partner_code))
-            & (existing_df["period"].astype(str) == str(year))
-            & (existing_df["flowCode"] == flow_code)
-        )
+        reporter_code = self._country_codes.get(reporter, reporter)
+        partner_code = self._country_codes.get(partner, partner)
+
+        key = (str(hs_code), reporter_code, partner_code, str(year), flow_code)
+        return key in existing_keys
+
+    def _cache_file(self, key: tuple[str, str, str, int, str]) -> Path:
+        """Get the on-disk cache path of an API response by its query key and mode."""
+        mode = "preview" if self.preview else "final"
+        digest = hashlib.blake2b("|".join(map(str, (mode, *key))).encode(), digest_size=16)
+        return self.cache_dir / f"{digest.hexdigest()}.pkl"
+
+    def _read_cached_response(self, key: tuple[str, str, str, int, str]) -> pd.DataFrame | None:
+        """Read an API response from the on-disk cache, or None if missing or expired."""
+        cache_file = self._cache_file(key)
+        try:
+            if time.time() - cache_file.stat().st_mtime >= self.cache_ttl:
+                return None
+            return pd.read_pickle(cache_file)
+        except Exception:  # a truncated or incompatible pickle is a cache miss
+            return None
+
+    def _write_cached_response(self, key: tuple[str, str, str, int, str], df: pd.DataFrame) -> None:
+        """Atomically write an API response to the on-disk cache."""
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.cache_dir, suffix=".tmp", delete=False
+        ) as tmp:
+            pickle.dump(df, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+        Path(tmp.name).replace(self._cache_file(key))
+
+    def _query_flows(
+        self,
+        pairs: list[tuple[str, int]],
+        reporter: str,
+        partner: str,
+        flow_code: str,
+    ) -> dict[tuple[str, int], pd.DataFrame]:
+        """
+        Query one trade flow for several (HS code, year) pairs in few API calls.
+
+        UN Comtrade accepts comma-separated commodity codes and periods, so
+        the pairs not already memoized (in-process or on disk) are grouped
+        into as few calls as possible (paced by the client's rate limiter)
+        covering only those pairs, and the response is split by cmdCode
+        and period. Pairs already being fetched for another commodity are
+        waited for rather than queried again. Responses are memoized, so the
+        returned DataFrames must not be modified.
 
-        return mask.any()
+        Returns:
+            Dictionary mapping (hs_code, year) to its records (empty if none)
+        """
+        results = {}
+        waiting = {}
+        missing = {}
+        with self._cache_lock:
+            for hs_code, year in pairs:
+                key = (hs_code, reporter, partner, year, flow_code)
+                cached = self._api_cache.get(key)
+                if cached is not None:
+                    results[(hs_code, year)] = cached
+                elif key in self._pending:
+                    waiting[(hs_code, year)] = self._pending[key]
+                else:
+                    missing[(hs_code, year)] = self._pending[key] = Future()
+
+        try:
+            # The claimed pairs are looked up on disk outside the lock, so
+            # workers do not wait for each other's file reads
+            for hs_code, year in list(missing):
+                key = (hs_code, reporter, partner, year, flow_code)
+                cached = self._read_cached_response(key)
+                if cached is not None:
+                    with self._cache_lock:
+                        self._api_cache[key] = cached
+                        del self._pending[key]
+                    missing.pop((hs_code, year)).set_result(cached)
+                    results[(hs_code, year)] = cached
+
+            for codes, years in self._group_pairs(list(missing)):
+                parts = self._fetch_flow_parts(
+                    codes, years, reporter=reporter, partner=partner, flow_code=flow_code
+                )
+                for (hs_code, year), part in parts.items():
+                    key = (hs_code, reporter, partner, year, flow_code)
+                    try:
+                        self._write_cached_response(key, part)
+                    except OSError as e:
+                        logger.warning(f"  Warning: Could not cache response: {e}")
+                    with self._cache_lock:
+                        self._api_cache[key] = part
+                        del self._pending[key]
+                    missing[(hs_code, year)].set_result(part)
+                    results[(hs_code, year)] = part
+        except BaseException as e:
+            # Let the waiting commodities see the same error, for every
+            # pair this call has not resolved yet
+            with self._cache_lock:
+                for (hs_code, year), future in missing.items():
+                    if not future.done():
+                        self._pending.pop((hs_code, reporter, partner, year, flow_code), None)
+                        future.set_exception(e)
+            raise
+
+        for (hs_code, year), future in waiting.items():
+            results[(hs_code, year)] = future.result()
+        return results
+
+    @staticmethod
+    def _group_pairs(pairs: list[tuple[str, int]]) -> list[tuple[list[str], list[int]]]:
+        """
+        Group (HS code, year) pairs into as few (HS codes, years) calls as possible.
+
+        The years needing the same set of HS codes (or the HS codes needing
+        the same set of years, whichever takes fewer calls) are grouped, so
+        each call covers exactly the given pairs rather than every code and
+        year among them.
+
+        Returns:
+            list of (hs_codes, years) tuples, one per API call
+        """
+        years_by_codes: dict[tuple[str, ...], list[int]] = {}
+        codes_by_year: dict[int, list[str]] = {}
+        for hs_code, year in pairs:
+            codes_by_year.setdefault(year, []).append(hs_code)
+        for year, codes in codes_by_year.items():
+            years_by_codes.setdefault(tuple(codes), []).append(year)
+
+        codes_by_years: dict[tuple[int, ...], list[str]] = {}
+        years_by_code: dict[str, list[int]] = {}
+        for hs_code, year in pairs:
+            years_by_code.setdefault(hs_code, []).append(year)
+        for hs_code, years in years_by_code.items():
+            codes_by_years.setdefault(tuple(years), []).append(hs_code)
+
+        if len(codes_by_years) < len(years_by_codes):
+            return [(codes, list(years)) for years, codes in codes_by_years.items()]
+        return [(list(codes), years) for codes, years in years_by_codes.items()]
+
+    def _fetch_flow_parts(
+        self,
+        hs_codes: list[str],
+        years: list[int],
+        *,
+        reporter: str,
+        partner: str,
+        flow_code: str,
+    ) -> dict[tuple[str, int], pd.DataFrame]:
+        """
+        Fetch one trade flow for every HS code and year given, split by pair.
+
+        A call whose response reaches the API's per-call record limit may be
+        missing records, so it is split (by HS code, then by year) and the
+        halves are fetched instead, down to one call per pair.
+
+        Returns:
+            Dictionary mapping (hs_code, year) to its records (empty if none)
+
+        Raises:
+            TruncatedResponseError: If a single pair still reaches the limit
+        """
+        try:
+            df = self.query.query_trade_data(
+                reporter=reporter,
+                partner=partner,
+                commodity_code=",".join(hs_codes),
+                year=",".join(map(str, years)),
+                trade_flow="import" if flow_code == "M" else "export",
+                preview=self.preview,
+            )
+        except TruncatedResponseError:
+            if len(hs_codes) > 1:
+                half = len(hs_codes) // 2
+                split = [(hs_codes[:half], years), (hs_codes[half:], years)]
+            elif len(years) > 1:
+                half = len(years) // 2
+                split = [(hs_codes, years[:half]), (hs_codes, years[half:])]
+            else:
+                raise
+            logger.info(f"    Response for {','.join(hs_codes)} truncated, splitting the query")
+            parts = {}
+            for part_codes, part_years in split:
+                parts.update(
+                    self._fetch_flow_parts(
+                        part_codes,
+                        part_years,
+                        reporter=reporter,
+                        partner=partner,
+                        flow_code=flow_code,
+                    )
+                )
+            return parts
+
+        # The flow is filtered by the API, so records are not filtered again here
+        if not df.empty and not (df["flowCode"] == flow_code).all():
+            other_flows = sorted(set(df["flowCode"]) - {flow_code})
+            raise ValueError(f"Expected only flow {flow_code} records, also got: {other_flows}")
+
+        groups = {}
+        if not df.empty:
+            groups = dict(
+                iter(df.groupby([df["cmdCode"].astype(str), df["period"].astype(str)], sort=False))
+            )
+        empty = pd.DataFrame()
+        return {
+            (hs_code, year): groups.get((hs_code, str(year)), empty)
+            for hs_code in hs_codes
+            for year in years
+        }
 
     def pull_commodity_trade_data(
         self,
@@ -196,118 +496,128 @@ class GoldQADataCollector:
         Returns:
             Dictionary with collected data and metadata
         """
-        print(f"\n{'=' * 80}")
-        print(f"Collecting data for: {commodity_name}")
-        print(f"HS Codes: {hs_codes}")
-        print(f"Country pairs: {countries}")
-        print(f"Years: {years}")
-        print(f"{'=' * 80}\n")
+        logger.info(f"\n{'=' * 80}")
+        logger.info(f"Collecting data for: {commodity_name}")
+        logger.info(f"HS Codes: {hs_codes}")
+        logger.info(f"Country pairs: {countries}")
+        logger.info(f"Years: {years}")
+        logger.info(f"{'=' * 80}\n")
 
         # Load existing data
-        existing_df = self._load_existing_data(commodity_name)
+        filepath = self._data_file(commodity_name)
+        existing_df = self._load_existing_data(filepath)
         if not existing_df.empty:
-            print(f"  Found existing data: {len(existing_df)} records")
+            logger.info(f"  Found existing data: {len(existing_df)} records")
+        existing_keys = set(self._row_keys(existing_df)) if not existing_df.empty else set()
 
         all_results = []
+        # (hs_code, year) of each DataFrame in all_results
+        result_queries = []
         query_count = 0
-        skipped_count = 0
 
         # Map flow codes
-        flows_to_query = []
-        if trade_flow == "both":
-            flows_to_query = ["M", "X"]
-        elif trade_flow == "import":
-            flows_to_query = ["M"]
-        elif trade_flow == "export":
-            flows_to_query = ["X"]
-
-        for hs_code in hs_codes:
-            for reporter, partner in countries:
-                for year in years:
-                    for flow_code in flows_to_query:
-                        # Create query identifier
-                        query_id = (
-                            f"{commodity_name}_{hs_code}_{reporter}_{partner}_{year}_{flow_code}"
-                        )
-
-                        # Skip if already queried in this session
-                        if query_id in self.query_log:
-                            skipped_count += 1
-                            continue
-
-                        # Check if data already exists
-                        if self._check_data_exists(
-                            existing_df, hs_code, reporter, partner, year, flow_code
-                        ):
-                            skipped_count += 1
-                            continue
-
-                        try:
-                            print(
-                                f"  Querying: {hs_code} | {reporter} -> {partner} | {year} | {flow_code}"
-                            )
-
-                            # Query single flow
-                            flow_for_query = "import" if flow_code == "M" else "export"
-                            df = self.query.query_trade_data(
-                                reporter=reporter,
-                                partner=partner,
-                                commodity_code=hs_code,
-                                year=year,
-                                trade_flow=flow_for_query,
-                            )
-
-                            if not df.empty:
-                                # Filter to the specific flow we want
-                                df_filtered = df[df["flowCode"] == flow_code].copy()
-                                if not df_filtered.empty:
-                                    # Add metadata columns
-                                    df_filtered["commodity_name"] = commodity_name
-                                    df_filtered["hs_code"] = hs_code
-                                    df_filtered["query_year"] = year
-                                    all_results.append(df_filtered)
-                                    query_count += 1
-                                    print(f"    ✓ Retrieved {len(df_filtered)} records")
-                                else:
-                                    print(f"    ✗ No data for flow {flow_code}")
-                            else:
-                                print("    ✗ No data returned")
-
-                            # Rate limiting: respect API limits (500 calls/day with key)
-                            time.sleep(0.5)  # Small delay between queries
-
-                            self.query_log.append(query_id)
-
-                        except (ValueError, KeyError, OSError) as e:
-                            print(f"    ✗ Error: {e}")
-                            continue
+        flows_to_query = FLOWS_BY_MODE.get(trade_flow, ())
+
+        # Work out which queries are still needed, skipping those already
+        # run in this session or whose data already exists. Each query is
+        # identified by its (commodity_name, hs_code, reporter, partner, year,
+        # flow_code) spec
+        all_specs = [
+            (commodity_name, hs_code, reporter, partner, year, flow_code)
+            for hs_code, (reporter, partner), year, flow_code in itertools.product(
+                hs_codes, countries, years, flows_to_query
+            )
+        ]
+        specs = [
+            query_id
+            for query_id in all_specs
+            if query_id not in self.query_log
+            and not self._check_data_exists(existing_keys, *query_id[1:])
+        ]
+        skipped_count = len(all_specs) - len(specs)
+
+        # Batch the queries sharing a reporter, partner and flow, so they
+        # are fetched in as few API calls as possible
+        batches: dict[tuple[str, str, str], list[tuple]] = {}
+        for query_id in specs:
+            _, _, reporter, partner, _, flow_code = query_id
+            batches.setdefault((reporter, partner, flow_code), []).append(query_id)
+
+        # Run the batches concurrently (paced by the shared rate limiter, which
+        # respects API limits of 500 calls/day with key) and handle the
+        # results in query order
+        workers = max(1, min(self.max_workers, len(batches)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = []
+            for (reporter, partner, flow_code), batch in batches.items():
+                batch_hs_codes = list(dict.fromkeys(query_id[1] for query_id in batch))
+                batch_years = list(dict.fromkeys(query_id[4] for query_id in batch))
+                pairs = [(query_id[1], query_id[4]) for query_id in batch]
+                future = executor.submit(self._query_flows, pairs, reporter, partner, flow_code)
+                futures.append((batch_hs_codes, batch_years, future))
+
+            for batch, (batch_hs_codes, batch_years, future) in zip(batches.values(), futures):
+                _, _, reporter, partner, _, flow_code = batch[0]
+                try:
+                    logger.info(
+                        f"  Querying: {','.join(batch_hs_codes)} | {reporter} -> {partner} | "
+                        f"{','.join(map(str, batch_years))} | {flow_code}"
+                    )
+                    results = future.result()
+
+                    for query_id in batch:
+                        _, hs_code, _, _, year, _ = query_id
+                        df = results[(hs_code, year)]
+                        if not df.empty:
+                            all_results.append(df)
+                            result_queries.append((hs_code, year))
+                            query_count += 1
+                            logger.info(f"    ✓ {hs_code} {year}: Retrieved {len(df)} records")
+                        else:
+                            logger.info(f"    ✗ {hs_code} {year}: No data returned")
+
+                        self.query_log.add(query_id)
+
+                except (ValueError, KeyError, OSError) as e:
+                    logger.error(f"    ✗ Error: {e}")
+                    continue
 
         # Combine with existing data if any
         if all_results:
-            new_df = pd.concat(all_results, ignore_index=True)
+            # Add metadata columns once, over all new records
+            lengths = [len(df) for df in all_results]
+            new_df = pd.concat(all_results, ignore_index=True).assign(
+                commodity_name=commodity_name,
+                hs_code=np.repeat([hs_code for hs_code, _ in result_queries], lengths),
+                query_year=np.repeat([year for _, year in result_queries], lengths),
+            )
 
             # Merge with existing data
             if not existing_df.empty:
-                # Combine and remove duplicates
+                # Only new records can duplicate existing ones, so drop the
+                # new records whose key is already present and keep the
+                # existing data as it is
+                is_new = [key not in existing_keys for key in self._row_keys(new_df)]
+                new_df = new_df[is_new]
                 combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-                # Remove duplicates based on key columns
-                key_cols = ["cmdCode", "reporterCode", "partnerCode", "period", "flowCode"]
-                if all(col in combined_df.columns for col in key_cols):
-                    combined_df = combined_df.drop_duplicates(subset=key_cols, keep="first")
             else:
                 combined_df = new_df
 
-            # Save to file
-            filename = f"{commodity_name.lower().replace(' ', '_')}_trade_data.csv"
-            filepath = self.output_dir / filename
-            combined_df.to_csv(filepath, index=False)
+            # Save to file, appending the new records to an existing file
+            # instead of rewriting it when they fit its columns
+            if existing_df.empty or not set(new_df.columns) <= set(existing_df.columns):
+                combined_df.to_csv(filepath, index=False)
+            elif not new_df.empty:
+                new_df.reindex(columns=existing_df.columns).to_csv(
+                    filepath, mode="a", header=False, index=False
+                )
 
-            new_records = len(new_df) if all_results else 0
+            new_records = len(new_df)
             total_records = len(combined_df)
-            print(f"\n  ✓ Added {new_records} new records")
-            print(f"  ✓ Total records: {total_records} (saved to {filepath})")
+            logger.info(f"\n  ✓ Added {new_records} new records")
+            logger.info(f"  ✓ Total records: {total_records} (saved to {filepath})")
             if skipped_count > 0:
-                print(f"  ✓ Skipped {skipped_count} queries (data already exists)")
+                logger.info(f"  ✓ Skipped {skipped_count} queries (data already exists)")
 
             return {
                 "commodity": commodity_name,
@@ -319,20 +629,18 @@ class GoldQADataCollector:
                 "dataframe": combined_df,
             }
         elif not existing_df.empty:
-            print(f"\n  ✓ No new data needed - {len(existing_df)} records already exist")
+            logger.info(f"\n  ✓ No new data needed - {len(existing_df)} records already exist")
             return {
                 "commodity": commodity_name,
                 "total_records": len(existing_df),
                 "new_records": 0,
-                "filepath": str(
-                    self.output_dir / f"{commodity_name.lower().replace(' ', '_')}_trade_data.csv"
-                ),
+                "filepath": str(filepath),
                 "queries_executed": 0,
                 "skipped": skipped_count,
                 "dataframe": existing_df,
             }
         else:
-            print(f"\n  ✗ No data collected for {commodity_name}")
+            logger.info(f"\n  ✗ No data collected for {commodity_name}")
             return {
                 "commodity": commodity_name,
                 "total_records": 0,
@@ -350,41 +658,46 @@ class GoldQADataCollector:
         Args:
             use_preview: If True, use preview mode (no API key, 500 records max)
         """
-        print("\n" + "=" * 80)
-        print("UN Comtrade Data Collection for CMM Gold Q&A Methodology")
-        print("=" * 80)
-        print(f"Output directory: {self.output_dir}")
-        print(f"Preview mode: {use_preview}")
-        print(f"Years: {YEARS}")
-        print("=" * 80)
-
-        summary = []
-
-        # Iterate through commodities with Q-TF questions
-        for commodity_name, config in COMMODITY_TRADE_FLOW_REQUIREMENTS.items():
-            if config["q_tf_questions"] == 0:
-                print(f"\nSkipping {commodity_name}: No Q-TF questions in methodology")
-                continue
-
-            hs_codes = config["hs_codes"]
-            if not hs_codes:
-                print(f"\nSkipping {commodity_name}: No HS codes defined")
-                continue
-
-            # Determine country pairs for this commodity
-            key_countries = config.get("key_countries", ["USA", "CHN"])
-            countries = self._get_country_pairs_for_commodity(key_countries)
-
-            # Pull data
-            result = self.pull_commodity_trade_data(
-                commodity_name=commodity_name,
-                hs_codes=hs_codes,
-                countries=countries,
-                years=YEARS,
-                trade_flow="both",
-            )
-
-            summary.append(result)
+        self.preview = use_preview
+
+        logger.info("\n" + "=" * 80)
+        logger.info("UN Comtrade Data Collection for CMM Gold Q&A Methodology")
+        logger.info("=" * 80)
+        logger.info(f"Output directory: {self.output_dir}")
+        logger.info(f"Preview mode: {use_preview}")
+        logger.info(f"Years: {YEARS}")
+        logger.info("=" * 80)
+
+        # Collect the commodities with Q-TF questions concurrently, keeping
+        # the summary in commodity order
+        futures = []
+        with ThreadPoolExecutor(max_workers=COMMODITY_WORKERS) as executor:
+            for commodity_name, config in COMMODITY_TRADE_FLOW_REQUIREMENTS.items():
+                if config["q_tf_questions"] == 0:
+                    logger.info(f"\nSkipping {commodity_name}: No Q-TF questions in methodology")
+                    continue
+
+                hs_codes = config["hs_codes"]
+                if not hs_codes:
+                    logger.info(f"\nSkipping {commodity_name}: No HS codes defined")
+                    continue
+
+                # Determine country pairs for this commodity
+                key_countries = config.get("key_countries", ["USA", "CHN"])
+                countries = self._get_country_pairs_for_commodity(key_countries)
+
+                # Pull data
+                future = executor.submit(
+                    self.pull_commodity_trade_data,
+                    commodity_name=commodity_name,
+                    hs_codes=hs_codes,
+                    countries=countries,
+                    years=YEARS,
+                    trade_flow="both",
+                )
+                futures.append(future)
+
+            summary = [future.result() for future in futures]
 
         # Save summary
         self._save_summary(summary)
@@ -424,7 +737,7 @@ class GoldQADataCollector:
         if "CHN" in key_countries:
             pairs.append(("CHN", "ALL"))  # China exports to all
 
-        return list(set(pairs))  # Remove duplicates
+        return list(dict.fromkeys(pairs))  # Remove duplicates, keeping order
 
     def _save_summary(self, summary: list[dict]):
         """Save collection summary to JSON file."""
@@ -447,16 +760,49 @@ class GoldQADataCollector:
             )
 
         summary_file = self.output_dir / "collection_summary.json"
-        with open(summary_file, "w") as f:
-            json.dump(summary_data, f, indent=2)
+        summary_file.write_bytes(dumps_json(summary_data, indent=True))
+
+        logger.info(f"\n{'=' * 80}")
+        logger.info("Collection Summary")
+        logger.info(f"{'=' * 80}")
+        logger.info(f"Total commodities processed: {len(summary)}")
+        logger.info(f"Total records collected: {sum([s['total_records'] for s in summary])}")
+        logger.info(f"Summary saved to: {summary_file}")
+        logger.info(f"{'=' * 80}\n")
+
+
+def setup_logging(log_file: str | None = None) -> QueueListener:
+    """
+    Send this module's and the API client's log messages to stdout and
+    optionally a log file.
+
+    Worker threads only put records on a queue; a background listener
+    thread formats and writes them, so logging never blocks a query.
+
+    Args:
+        log_file: Path of a (rotated) log file to also write to
+
+    Returns:
+        The started listener, to be stopped once collection is done
+    """
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    handlers = [console]
+    if log_file:
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=10 * 1024 * 1024, backupCount=3, encoding="utf-8", delay=True
+        )
+        file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        handlers.append(file_handler)
 
-        print(f"\n{'=' * 80}")
-        print("Collection Summary")
-        print(f"{'=' * 80}")
-        print(f"Total commodities processed: {len(summary)}")
-        print(f"Total records collected: {sum([s['total_records'] for s in summary])}")
-        print(f"Summary saved to: {summary_file}")
-        print(f"{'=' * 80}\n")
+    log_queue = queue.SimpleQueue()
+    for module_logger in (logger, logging.getLogger(ComtradeQuery.__module__)):
+        module_logger.addHandler(QueueHandler(log_queue))
+        module_logger.setLevel(logging.INFO)
+        module_logger.propagate = False
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    return listener
 
 
 def main():
@@ -496,33 +842,62 @@ Examples:
         help="Use preview mode (no API key needed, 500 records max per query)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Maximum number of concurrent API calls (default: {DEFAULT_MAX_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=RESPONSE_CACHE_TTL / (24 * 60 * 60),
+        help="Days a cached API response is reused before querying again (default: 30)",
+    )
+
+    parser.add_argument(
+        "--rate-limit",
+        type=_parse_rate_limit,
+        metavar="CALLS_PER_SECOND",
+        help="Most API calls to start per second, 0 for no limit "
+        f"(default: COMTRADE_RATE or {DEFAULT_RATE_LIMIT:g})",
+    )
+
+    parser.add_argument(
+        "--log-file",
+        type=str,
+        help="Also write the collection log to this file (rotated at 10 MB)",
+    )
+
     args = parser.parse_args()
+    listener = setup_logging(args.log_file)
 
     # Initialize collector
-    collector = GoldQADataCollector(api_key=args.api_key, output_dir=args.output_dir)
-
-    # Note: Preview mode would need to be passed through the query methods
-    # For now, if preview is requested, the user should use preview mode manually
-    if args.preview:
-        print("\nNote: Preview mode requires modifying the query calls.")
-        print("Consider using the main query script with --preview flag for testing.\n")
+    collector = GoldQADataCollector(
+        api_key=args.api_key,
+        output_dir=args.output_dir,
+        max_workers=args.workers,
+        cache_ttl=args.cache_ttl * 24 * 60 * 60,
+        rate_limit=args.rate_limit,
+    )
 
     # Collect all data
     try:
         collector.pull_all_gold_qa_data(use_preview=args.preview)
 
-        print("\n✓ Data collection complete!")
-        print(f"Check {args.output_dir} for results.")
+        logger.info("\n✓ Data collection complete!")
+        logger.info(f"Check {args.output_dir} for results.")
 
     except KeyboardInterrupt:
-        print("\n\nCollection interrupted by user.")
+        logger.info("\n\nCollection interrupted by user.")
         sys.exit(1)
     except Exception as e:
-        print(f"\n✗ Error during collection: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"\n✗ Error during collection: {e}")
         sys.exit(1)
+    finally:
+        # Write out any queued log messages
+        listener.stop()
 
 
 if __name__ == "__main__":
@@ -31,11 +31,25 @@ Or set API key as environment variable:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import logging
 import os
+import pickle
 import sys
+import tempfile
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
 
 import pandas as pd
+import requests
+from _common import RateLimiter, loads_json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 warnings.warn(
     "un_comtrade_query.py is deprecated. Use the UNComtrade MCP Server instead "
@@ -44,62 +58,256 @@ warnings.warn(
     stacklevel=2,
 )
 
-try:
-    from comtradeapicall import getFinalData, previewFinalData
-except ImportError:
-    print("Error: comtradeapicall package not found. Please install it with:")
-    print("  pip install comtradeapicall")
-    sys.exit(1)
+logger = logging.getLogger(__name__)
+
+# UN Comtrade REST endpoints, followed by /{typeCode}/{freqCode}/{clCode}:
+# final data (subscription key required) and preview data (no key needed)
+FINAL_DATA_URL = "https://comtradeapi.un.org/data/v1/get"
+PREVIEW_DATA_URL = "https://comtradeapi.un.org/public/v1/preview"
+
+# Maximum records per call for final and preview data
+FINAL_MAX_RECORDS = 250000
+PREVIEW_MAX_RECORDS = 500
+
+# Seconds to wait for the API to respond
+REQUEST_TIMEOUT = 120
+
+# Most commodity codes the API accepts in one call, and how many such calls
+# query_many runs at the same time
+MAX_CODES_PER_QUERY = 20
+DEFAULT_MAX_WORKERS = 4
+
+# Responses memoized per ComtradeQuery instance
+QUERY_CACHE_SIZE = 2048
+
+# On-disk response cache used by the command-line tool, and how long its
+# entries are reused before the API is queried again (seconds)
+DEFAULT_CACHE_DIR = Path("~/.cache/un_comtrade").expanduser()
+RESPONSE_CACHE_TTL = 30 * 24 * 60 * 60
+
+# API calls started per second, across all threads of a ComtradeQuery
+# (0 for no limit); set COMTRADE_RATE to match your subscription's quota
+DEFAULT_RATE_LIMIT = 2.0
+
+# save_results writers by format, called as writer(df, path, compression),
+# and the format inferred from each file extension
+_WRITERS = MappingProxyType(
+    {
+        "csv": lambda df, path, _compression: df.to_csv(path, index=False),
+        "json": lambda df, path, _compression: df.to_json(path, orient="records", indent=2),
+        "excel": lambda df, path, _compression: df.to_excel(path, index=False),
+        "parquet": lambda df, path, compression: df.to_parquet(
+            path, compression=compression, index=False
+        ),
+        "feather": lambda df, path, compression: df.to_feather(
+            path, compression=compression or "uncompressed"
+        ),
+    }
+)
+_EXT_FMT = MappingProxyType(
+    {
+        ".csv": "csv",
+        ".json": "json",
+        ".xlsx": "excel",
+        ".xls": "excel",
+        ".parquet": "parquet",
+        ".feather": "feather",
+    }
+)
+
+# UN Comtrade flow codes queried for each trade_flow: 'M' import, 'X' export
+_FLOWS_TO_QUERY = MappingProxyType({"both": ("M", "X"), "import": ("M",), "export": ("X",)})
+
+# Response columns stored compactly in query results: repetitive text columns
+# as categoricals, integer code columns in the smallest integer type that
+# holds them. Value and quantity columns stay float64, as float32 keeps only
+# ~7 significant digits and would round trade values in the millions.
+_CATEGORY_COLUMNS = (
+    "typeCode",
+    "freqCode",
+    "reporterISO",
+    "reporterDesc",
+    "flowCode",
+    "flowDesc",
+    "partnerISO",
+    "partnerDesc",
+    "partner2ISO",
+    "partner2Desc",
+    "classificationCode",
+    "classificationSearchCode",
+    "cmdCode",
+    "cmdDesc",
+    "customsCode",
+    "customsDesc",
+    "motDesc",
+    "qtyUnitAbbr",
+    "altQtyUnitAbbr",
+)
+_INTEGER_COLUMNS = (
+    "refPeriodId",
+    "refYear",
+    "refMonth",
+    "period",
+    "reporterCode",
+    "partnerCode",
+    "partner2Code",
+    "aggrLevel",
+    "mosCode",
+    "motCode",
+    "qtyUnitCode",
+    "altQtyUnitCode",
+    "legacyEstimationFlag",
+)
 
 # CMM HS Codes (per UNCTAD mapping from CMM_API_MCP_Analysis.md)
-CMM_HS_CODES = {
-    # Rare Earth Elements
-    "REE_compounds": "2846",  # Rare earth compounds
-    "REE_metals": "280530",  # Rare earth metals
-    # Lithium
-    "Lithium_ores": "253090",  # Lithium ores/carbonate
-    "Lithium_carbonate": "283691",  # Lithium carbonate
-    "Lithium_hydroxide": "282520",  # Lithium hydroxide
-    # Cobalt
-    "Cobalt": "8105",  # Cobalt and articles
-    "Cobalt_oxides": "282200",  # Cobalt oxides
-    # Graphite
-    "Graphite_natural": "250410",  # Natural graphite
-    "Graphite_artificial": "380110",  # Artificial graphite
-    # Gallium and Germanium
-    "Gallium_Germanium": "811292",  # Gallium and Germanium
-    # Nickel (for battery-grade Class 1 nickel)
-    "Nickel_unwrought": "7502",  # Unwrought nickel (refined)
-    "Nickel_matte": "7501",  # Nickel mattes and intermediate products
-    "Nickel_oxides": "281122",  # Nickel oxides and hydroxides
-    # Copper
-    "Copper_refined": "7402",  # Unwrought refined copper
-    "Copper_unrefined": "7403",  # Unwrought unrefined copper
-}
+CMM_HS_CODES = MappingProxyType(
+    {
+        # Rare Earth Elements
+        "REE_compounds": "2846",  # Rare earth compounds
+        "REE_metals": "280530",  # Rare earth metals
+        # Lithium
+        "Lithium_ores": "253090",  # Lithium ores/carbonate
+        "Lithium_carbonate": "283691",  # Lithium carbonate
+        "Lithium_hydroxide": "282520",  # Lithium hydroxide
+        # Cobalt
+        "Cobalt": "8105",  # Cobalt and articles
+        "Cobalt_oxides": "282200",  # Cobalt oxides
+        # Graphite
+        "Graphite_natural": "250410",  # Natural graphite
+        "Graphite_artificial": "380110",  # Artificial graphite
+        # Gallium and Germanium
+        "Gallium_Germanium": "811292",  # Gallium and Germanium
+        # Nickel (for battery-grade Class 1 nickel)
+        "Nickel_unwrought": "7502",  # Unwrought nickel (refined)
+        "Nickel_matte": "7501",  # Nickel mattes and intermediate products
+        "Nickel_oxides": "281122",  # Nickel oxides and hydroxides
+        # Copper
+        "Copper_refined": "7402",  # Unwrought refined copper
+        "Copper_unrefined": "7403",  # Unwrought unrefined copper
+    }
+)
+
+# CMM commodity name by HS code
+HS_TO_CMM = MappingProxyType({code: name for name, code in CMM_HS_CODES.items()})
+
+# Commodity names as listed in error messages
+_CMM_NAMES_JOINED = ", ".join(CMM_HS_CODES)
 
 # ISO country codes to UN Comtrade numeric codes
 # UN Comtrade uses numeric codes: https://unstats.un.org/unsd/tradekb/knowledgebase/country-code
-COUNTRY_CODES = {
-    "USA": "842",  # United States
-    "CHN": "156",  # China
-    "DEU": "276",  # Germany
-    "JPN": "392",  # Japan
-    "KOR": "410",  # South Korea
-    "AUS": "36",  # Australia
-    "CAN": "124",  # Canada
-    "GBR": "826",  # United Kingdom
-    "FRA": "250",  # France
-    "IND": "699",  # India
-    "COD": "180",  # Democratic Republic of the Congo (DRC)
-    "IDN": "360",  # Indonesia
-    "ALL": "0",  # All partners
-}
+COUNTRY_CODES = MappingProxyType(
+    {
+        "USA": "842",  # United States
+        "CHN": "156",  # China
+        "DEU": "276",  # Germany
+        "JPN": "392",  # Japan
+        "KOR": "410",  # South Korea
+        "AUS": "36",  # Australia
+        "CAN": "124",  # Canada
+        "GBR": "826",  # United Kingdom
+        "FRA": "250",  # France
+        "IND": "699",  # India
+        "COD": "180",  # Democratic Republic of the Congo (DRC)
+        "IDN": "360",  # Indonesia
+        "ALL": "0",  # All partners
+    }
+)
+
+# ISO country code by UN Comtrade numeric code
+NUMERIC_TO_ISO = MappingProxyType({numeric: iso for iso, numeric in COUNTRY_CODES.items()})
+
+# ISO country codes as listed in error messages
+_COUNTRY_CODES_JOINED = ", ".join(COUNTRY_CODES)
+
+
+def _normalize_country(code: str) -> str:
+    """
+    Convert a country code to the UN Comtrade numeric code.
+
+    Args:
+        code: ISO 3-letter country code (e.g., 'USA'), or numeric UN Comtrade
+            code(s), comma-separated for several countries
+
+    Returns:
+        Numeric UN Comtrade code(s)
+
+    Raises:
+        ValueError: If the code is neither a known ISO code nor numeric
+    """
+    numeric = COUNTRY_CODES.get(code.upper())
+    if numeric is not None:
+        return numeric
+    if code.replace(",", "").isdigit():
+        return code
+    raise ValueError(
+        f"Unknown country code: {code}. Use a numeric UN Comtrade code or one of: "
+        f"{_COUNTRY_CODES_JOINED}"
+    )
+
+
+def _compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink a query result's memory without changing its values.
+
+    Args:
+        df: Query result, modified in place
+
+    Returns:
+        The same DataFrame
+    """
+    for col in _CATEGORY_COLUMNS:
+        if col in df and not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = df[col].astype("category")
+    for col in _INTEGER_COLUMNS:
+        if col in df and pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+def _parse_rate_limit(value: str) -> float:
+    """
+    Parse a rate limit in calls per second.
+
+    Raises:
+        ValueError: If the value is not a number >= 0
+    """
+    rate = float(value)
+    if not rate >= 0:  # also rejects NaN
+        raise ValueError(f"rate limit must be a number >= 0, got: {value}")
+    return rate
+
+
+def _rate_limit_from_env() -> float:
+    """Get the rate limit set by COMTRADE_RATE, or the default if unset or invalid."""
+    value = os.getenv("COMTRADE_RATE")
+    if value is None:
+        return DEFAULT_RATE_LIMIT
+    try:
+        return _parse_rate_limit(value)
+    except ValueError:
+        warnings.warn(
+            f"Ignoring invalid COMTRADE_RATE={value!r} (calls per second, 0 for no limit); "
+            f"using {DEFAULT_RATE_LIMIT}",
+            stacklevel=3,
+        )
+        return DEFAULT_RATE_LIMIT
+
+
+class TruncatedResponseError(ValueError):
+    """An API call returned as many records as it may, so some may be missing."""
 
 
 class ComtradeQuery:
     """Class to handle UN Comtrade API queries for CMM data."""
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        use_cache: bool = True,
+        cache_dir: str | Path | None = None,
+        cache_ttl: float = RESPONSE_CACHE_TTL,
+        rate_limit: float | None = None,
+    ):
         """
         Initialize ComtradeQuery instance.
 
@@ -107,12 +315,113 @@ class ComtradeQuery:
             api_key: UN Comtrade API key. If None, will try to get from
                     UN_COMTRADE_API_KEY environment variable. API key is only
                     required for non-preview queries (preview mode doesn't need it).
+            use_cache: Answer repeated queries from memory instead of the API
+            cache_dir: Directory to also cache responses in across runs (None
+                    to keep them in memory only)
+            cache_ttl: Seconds an on-disk response is reused for
+            rate_limit: Most API calls to start per second (0 for no limit);
+                    cached responses do not count. If None, read from the
+                    COMTRADE_RATE environment variable (default: 2)
         """
         if api_key is None:
             api_key = os.getenv("UN_COMTRADE_API_KEY")
 
         self.api_key = api_key  # Store None if not provided (OK for preview mode)
 
+        self.cache_dir = Path(cache_dir) if cache_dir is not None and use_cache else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_ttl = cache_ttl
+
+        # Throttle calls on the client side: bursting past the quota only
+        # earns 429s, whose Retry-After waits are far longer than the spacing
+        if rate_limit is None:
+            rate_limit = _rate_limit_from_env()
+        elif not rate_limit >= 0:
+            raise ValueError(f"rate_limit must be >= 0, got: {rate_limit}")
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit > 0 else None
+
+        # One session for every query, so calls reuse keep-alive connections
+        # instead of paying for a fresh TCP+TLS handshake each time. Enough
+        # connections are pooled for callers querying from several threads,
+        # and transient failures (429/5xx, dropped connections) are retried
+        # with jittered exponential backoff that honours Retry-After.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                backoff_max=30,
+                backoff_jitter=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+                respect_retry_after_header=True,
+            ),
+        )
+        self.session.mount("https://", adapter)
+
+        # Memoize responses by query parameters, so repeating a query costs a
+        # dict lookup instead of an API call (failed calls raise, so they are
+        # never memoized). Least recently used entries are dropped first.
+        self._memo: dict[tuple, pd.DataFrame] = {}
+        self._memo_size = QUERY_CACHE_SIZE if use_cache else 0
+        self._memo_lock = threading.Lock()
+
+    def cache_clear(self) -> None:
+        """Forget memoized query responses."""
+        with self._memo_lock:
+            self._memo.clear()
+
+    def clear_disk_cache(self) -> int:
+        """
+        Forget memoized query responses, including those cached on disk.
+
+        Returns:
+            Number of on-disk responses removed
+        """
+        self.cache_clear()
+        if self.cache_dir is None:
+            return 0
+        removed = 0
+        for cache_file in self.cache_dir.glob("*.pkl"):
+            cache_file.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def _cache_file(self, url: str, params: dict) -> Path:
+        """Get the on-disk cache path of an API response by its URL and parameters."""
+        key = json.dumps([url, params], sort_keys=True).encode()
+        return self.cache_dir / f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.pkl"
+
+    def _read_cached_response(self, cache_file: Path) -> pd.DataFrame | None:
+        """Read an API response from the on-disk cache, or None if missing or expired."""
+        try:
+            if time.time() - cache_file.stat().st_mtime >= self.cache_ttl:
+                return None
+            return pd.read_pickle(cache_file)
+        except Exception:  # a truncated or incompatible pickle is a cache miss
+            return None
+
+    def _write_cached_response(self, cache_file: Path, df: pd.DataFrame) -> None:
+        """Atomically write an API response to the on-disk cache."""
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.cache_dir, suffix=".tmp", delete=False
+        ) as tmp:
+            pickle.dump(df, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+        Path(tmp.name).replace(cache_file)
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> ComtradeQuery:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def query_trade_data(
         self,
         reporter: str,
@@ -131,99 +440,254 @@ class ComtradeQuery:
             commodity_code: HS commodity code (e.g., '2846' for REE compounds)
             year: Year of trade data (e.g., 2023)
             trade_flow: 'import' (1), 'export' (2), or 'both' (queries both)
-            preview: If True, uses previewFinalData (500 records, no key needed)
-                    If False, uses getFinalData (up to 250,000 records, requires key)
+            preview: If True, uses the preview API (500 records, no key needed)
+                    If False, uses the final data API (up to 250,000 records, requires key)
 
         Returns:
-            pandas DataFrame with trade data
+            pandas DataFrame with trade data, its repetitive text columns as
+            categoricals
+
+        Raises:
+            ValueError: If trade_flow or a country code is invalid, or the
+                API reports an error
+            TruncatedResponseError: If a call hits the per-call record limit
+            requests.RequestException: If an API call fails
         """
-        results = []
-
-        flows_to_query = []
-        if trade_flow == "both":
-            flows_to_query = ["1", "2"]  # Import and Export
-        elif trade_flow == "import":
-            flows_to_query = ["1"]
-        elif trade_flow == "export":
-            flows_to_query = ["2"]
+        try:
+            flows_to_query = _FLOWS_TO_QUERY[trade_flow]
+        except KeyError:
+            raise ValueError(
+                f"trade_flow must be 'import', 'export', or 'both', got: {trade_flow}"
+            ) from None
+
+        # Validate API key is present for non-preview queries (once, as it
+        # is the same for every flow)
+        if not preview and not self.api_key:
+            logger.warning(
+                f"Warning: Error querying {reporter}-{partner}: "
+                "API key required for non-preview queries. "
+                "Provide it as parameter to ComtradeQuery() or set "
+                "UN_COMTRADE_API_KEY environment variable. "
+                "Register at: https://comtradedeveloper.un.org/apis"
+            )
+            return pd.DataFrame()
+
+        # Everything but the flow code is the same for each flow's call, so
+        # it is resolved once, with the country codes in numeric format
+        fetch_args = {
+            "period": str(year),
+            "reporter_code": _normalize_country(reporter),
+            "commodity_code": commodity_code,
+            "partner_code": _normalize_country(partner),
+            "preview": preview,
+        }
+
+        def query_flow(flow: str) -> pd.DataFrame:
+            try:
+                return self._fetch_flow(flow_code=flow, **fetch_args)
+            except TruncatedResponseError:
+                # Expected for large queries, which callers split up
+                raise
+            except (ValueError, TypeError, OSError) as e:
+                # Raised on to the caller, so a failed call is not mistaken
+                # for a query without trade
+                logger.warning(f"Warning: Error querying flow {flow} for {reporter}-{partner}: {e}")
+                raise
+
+        # Each flow is a separate API call, so the calls of a 'both' query
+        # run at the same time
+        if len(flows_to_query) > 1:
+            with ThreadPoolExecutor(max_workers=len(flows_to_query)) as executor:
+                flow_data = list(executor.map(query_flow, flows_to_query))
         else:
-            raise ValueError(f"trade_flow must be 'import', 'export', or 'both', got: {trade_flow}")
+            flow_data = [query_flow(flow) for flow in flows_to_query]
+        results = [data for data in flow_data if not data.empty]
 
-        # Convert country codes to numeric format
-        reporter_code = COUNTRY_CODES.get(reporter, reporter)
-        partner_code = COUNTRY_CODES.get(partner, partner)
-
-        # Map flow codes: '1' or 'import' -> 'M', '2' or 'export' -> 'X'
-        flow_map = {"1": "M", "2": "X", "import": "M", "export": "X"}
+        if results:
+            # concat always copies, even a single frame; keep it that way, as
+            # the frames are shared with the response cache and callers may
+            # modify the result in place
+            combined_df = pd.concat(results, ignore_index=True)
+            return _compact_dtypes(combined_df)
+        else:
+            return pd.DataFrame()  # Return empty DataFrame if no results
 
-        for flow in flows_to_query:
-            try:
-                # Convert flow code to UN Comtrade format
-                flow_code = flow_map.get(flow, flow)
-                if flow_code not in ["M", "X"]:
-                    raise ValueError(
-                        f"Invalid flow code: {flow}. Must be 'M' (import) or 'X' (export)"
-                    )
+    def _fetch_flow(
+        self,
+        *,
+        period: str,
+        reporter_code: str,
+        commodity_code: str,
+        flow_code: str,
+        partner_code: str,
+        preview: bool,
+    ) -> pd.DataFrame:
+        """
+        Fetch a single trade flow from UN Comtrade API.
+
+        Responses are memoized per instance and, with a cache_dir, also
+        cached on disk, including empty ones so queries without data are not
+        repeated until the entry expires. The returned DataFrame must not be
+        modified.
+
+        Raises:
+            requests.RequestException: If the request fails
+            ValueError: If the API reports an error
+            TruncatedResponseError: If the response holds maxRecords records,
+                so it may be missing some (it is not cached)
+        """
+        memo_key = (period, reporter_code, commodity_code, flow_code, partner_code, preview)
+        with self._memo_lock:
+            memoized = self._memo.pop(memo_key, None)
+            if memoized is not None:
+                # Re-inserted to mark it as most recently used
+                self._memo[memo_key] = memoized
+                return memoized
+
+        params = {
+            "period": period,
+            "reporterCode": reporter_code,
+            "cmdCode": commodity_code,
+            "flowCode": flow_code,  # 'M' for import, 'X' for export
+            "partnerCode": partner_code,
+        }
+        if not preview:
+            url = FINAL_DATA_URL
+            params["maxRecords"] = FINAL_MAX_RECORDS
+            headers = {"Ocp-Apim-Subscription-Key": self.api_key}
+        else:
+            url = PREVIEW_DATA_URL
+            params["maxRecords"] = PREVIEW_MAX_RECORDS
+            headers = {}
+
+        # Commodities (C), annual (A), Harmonized System (HS)
+        url = f"{url}/C/A/HS"
+        cache_file = None
+        if self.cache_dir is not None:
+            cache_file = self._cache_file(url, params)
+            cached = self._read_cached_response(cache_file)
+            if cached is not None:
+                self._memoize(memo_key, cached)
+                return cached
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+        response = self.session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        # Parse the raw body directly (orjson is several times faster than
+        # the standard library on large responses)
+        payload = loads_json(response.content)
+        if payload.get("error"):
+            raise ValueError(f"UN Comtrade API error: {payload['error']}")
+        data = payload.get("data") or []
+        if len(data) >= params["maxRecords"]:
+            raise TruncatedResponseError(
+                f"UN Comtrade returned the maximum of {params['maxRecords']} records "
+                f"for cmdCode={commodity_code} period={period}; query fewer codes or years"
+            )
+        df = pd.DataFrame(data)
+        if cache_file is not None:
+            self._write_cached_response(cache_file, df)
+        self._memoize(memo_key, df)
+        return df
+
+    def _memoize(self, key: tuple, df: pd.DataFrame) -> None:
+        """Memoize a response, dropping the least recently used one when full."""
+        if not self._memo_size:
+            return
+        with self._memo_lock:
+            self._memo[key] = df
+            if len(self._memo) > self._memo_size:
+                del self._memo[next(iter(self._memo))]
+
+    def query_many(
+        self,
+        reporters: list[str],
+        partners: list[str],
+        commodity_codes: list[str],
+        years: list[int],
+        *,
+        trade_flow: str = "both",
+        preview: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> pd.DataFrame:
+        """
+        Query trade data for several countries, commodities and years at once.
 
-                # Format period as year string (e.g., '2023')
-                period = str(year)
-
-                if not preview:
-                    # Validate API key is present for non-preview queries
-                    if not self.api_key:
-                        raise ValueError(
-                            "API key required for non-preview queries. "
-                            "Provide it as parameter to ComtradeQuery() or set "
-                            "UN_COMTRADE_API_KEY environment variable. "
-                            "Register at: https://comtradedeveloper.un.org/apis"
-                        )
-                    # getFinalData parameters: (subscription_key, typeCode, freqCode, clCode, period,
-                    #                          reporterCode, cmdCode, flowCode, partnerCode,
-                    #                          partner2Code, customsCode, motCode, ...)
-                    data = getFinalData(
-                        subscription_key=self.api_key,
-                        typeCode="C",  # Commodities
-                        freqCode="A",  # Annual
-                        clCode="HS",  # Harmonized System
-                        period=period,
-                        reporterCode=reporter_code,
-                        cmdCode=commodity_code,
-                        flowCode=flow_code,  # 'M' for import, 'X' for export
-                        partnerCode=partner_code,
-                        partner2Code=None,  # Not used
-                        customsCode=None,  # Not used
-                        motCode=None,  # Not used
-                    )
-                else:
-                    # previewFinalData parameters: (typeCode, freqCode, clCode, period, reporterCode,
-                    #                               cmdCode, flowCode, partnerCode, partner2Code,
-                    #                               customsCode, motCode, ...)
-                    data = previewFinalData(
-                        typeCode="C",
-                        freqCode="A",
-                        clCode="HS",
-                        period=period,
-                        reporterCode=reporter_code,
-                        cmdCode=commodity_code,
-                        flowCode=flow_code,
-                        partnerCode=partner_code,
-                        partner2Code=None,
-                        customsCode=None,
-                        motCode=None,
-                    )
+        UN Comtrade accepts comma-separated reporter, partner, commodity and
+        period codes, so every combination is fetched in one call per flow
+        and per chunk of up to MAX_CODES_PER_QUERY commodity codes, with the
+        chunks queried concurrently. A chunk whose response reaches the
+        per-call record limit is halved (by commodity code, then by year)
+        and queried again, so no records are silently dropped.
 
-                if data is not None and not data.empty:
-                    results.append(data)
+        Args:
+            reporters: ISO 3-letter country codes for reporting countries
+            partners: ISO 3-letter country codes for partner countries
+            commodity_codes: HS commodity codes
+            years: Years of trade data
+            trade_flow: 'import', 'export', or 'both'
+            preview: Use preview API (limited to 500 records per call)
+            max_workers: Maximum number of chunks queried at the same time
 
-            except (ValueError, TypeError, OSError) as e:
-                print(f"Warning: Error querying flow {flow} for {reporter}-{partner}: {e}")
-                continue
+        Returns:
+            pandas DataFrame with trade data
 
+        Raises:
+            ValueError: If trade_flow or a country code is invalid, or the
+                API reports an error
+            TruncatedResponseError: If a single commodity code and year
+                still hits the per-call record limit
+            requests.RequestException: If an API call fails
+        """
+        # Country codes are converted here, as query_trade_data only converts
+        # a single code
+        reporter_codes = ",".join(map(_normalize_country, reporters))
+        partner_codes = ",".join(map(_normalize_country, partners))
+        years = list(dict.fromkeys(years))
+        codes = list(dict.fromkeys(commodity_codes))
+        chunks = [
+            codes[i : i + MAX_CODES_PER_QUERY] for i in range(0, len(codes), MAX_CODES_PER_QUERY)
+        ]
+
+        def query_chunk(chunk: list[str], chunk_years: list[int]) -> list[pd.DataFrame]:
+            try:
+                df = self.query_trade_data(
+                    reporter=reporter_codes,
+                    partner=partner_codes,
+                    commodity_code=",".join(chunk),
+                    year=",".join(map(str, chunk_years)),
+                    trade_flow=trade_flow,
+                    preview=preview,
+                )
+            except TruncatedResponseError:
+                if len(chunk) > 1:
+                    half = len(chunk) // 2
+                    return query_chunk(chunk[:half], chunk_years) + query_chunk(
+                        chunk[half:], chunk_years
+                    )
+                if len(chunk_years) > 1:
+                    half = len(chunk_years) // 2
+                    return query_chunk(chunk, chunk_years[:half]) + query_chunk(
+                        chunk, chunk_years[half:]
+                    )
+                raise
+            return [df] if not df.empty else []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+            results = [
+                df
+                for chunk_results in executor.map(query_chunk, chunks, [years] * len(chunks))
+                for df in chunk_results
+            ]
+
+        if len(results) == 1:
+            # Already a fresh frame from query_trade_data, so skip the copy
+            return results[0]
         if results:
-            combined_df = pd.concat(results, ignore_index=True)
-            return combined_df
-        else:
-            return pd.DataFrame()  # Return empty DataFrame if no results
+            # Categoricals with different categories concatenate to object
+            return _compact_dtypes(pd.concat(results, ignore_index=True))
+        return pd.DataFrame()
 
     def query_cmm_commodity(
         self,
@@ -248,11 +712,12 @@ class ComtradeQuery:
         Returns:
             pandas DataFrame with trade data
         """
-        if commodity_name not in CMM_HS_CODES:
-            available = ", ".join(CMM_HS_CODES.keys())
-            raise ValueError(f"Unknown commodity: {commodity_name}. Available options: {available}")
+        hs_code = CMM_HS_CODES.get(commodity_name)
+        if hs_code is None:
+            raise ValueError(
+                f"Unknown commodity: {commodity_name}. Available options: {_CMM_NAMES_JOINED}"
+            )
 
-        hs_code = CMM_HS_CODES[commodity_name]
         return self.query_trade_data(
             reporter=reporter,
             partner=partner,
@@ -262,34 +727,47 @@ class ComtradeQuery:
             preview=preview,
         )
 
-    def save_results(self, df: pd.DataFrame, output_file: str, format: str = "auto"):
+    def save_results(
+        self,
+        df: pd.DataFrame,
+        output_file: str,
+        format: str = "auto",
+        compression: str | None = "zstd",
+    ):
         """
         Save query results to file.
 
+        Parquet and Feather (which need pyarrow) are columnar binary formats,
+        much smaller than CSV and many times faster to load again.
+
         Args:
             df: DataFrame to save
             output_file: Output file path
-            format: File format ('csv', 'json', 'excel', or 'auto' to infer from extension)
+            format: File format ('csv', 'json', 'excel', 'parquet', 'feather', or
+                    'auto' to infer from extension)
+            compression: Parquet/Feather compression codec (e.g., 'zstd',
+                    'snappy', or None for uncompressed)
         """
         if format == "auto":
             ext = os.path.splitext(output_file)[1].lower()
-            if ext == ".csv":
-                format = "csv"
-            elif ext == ".json":
-                format = "json"
-            elif ext in [".xlsx", ".xls"]:
-                format = "excel"
-            else:
-                format = "csv"  # Default to CSV
-
-        if format == "csv":
-            df.to_csv(output_file, index=False)
-        elif format == "json":
-            df.to_json(output_file, orient="records", indent=2)
-        elif format == "excel":
-            df.to_excel(output_file, index=False)
-        else:
+            format = _EXT_FMT.get(ext, "csv")  # Default to CSV
+
+        writer = _WRITERS.get(format)
+        if writer is None:
             raise ValueError(f"Unsupported format: {format}")
+        writer(df, output_file, compression)
+
+
+def _parse_years(text: str) -> list[int]:
+    """Parse a year ('2023') or inclusive year range ('2018-2023') CLI argument."""
+    try:
+        first, _, last = text.partition("-")
+        years = list(range(int(first), int(last or first) + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid year range: {text}") from None
+    if not years:
+        raise argparse.ArgumentTypeError(f"empty year range: {text}")
+    return years
 
 
 def main():
@@ -311,6 +789,9 @@ Examples:
   # Save to CSV
   python un_comtrade_query.py --reporter USA --partner CHN --commodity 2846 --year 2023 --output results.csv
 
+  # Sweep all CMM commodities over 2018-2023, a few API calls at a time
+  python un_comtrade_query.py --reporter USA --partner CHN --sweep-commodities --sweep-years 2018-2023
+
   # list available CMM commodities
   python un_comtrade_query.py --list-commodities
         """,
@@ -342,6 +823,34 @@ Examples:
 
     parser.add_argument("--year", type=int, help="Year of trade data (e.g., 2023)")
 
+    parser.add_argument(
+        "--sweep-commodities",
+        action="store_true",
+        help="Query all CMM commodities (labelled in a commodity_name column)",
+    )
+
+    parser.add_argument(
+        "--sweep-years",
+        type=_parse_years,
+        metavar="START-END",
+        help="Query every year in an inclusive range (e.g., 2018-2023) instead of --year",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"API calls to run at the same time in a sweep (default: {DEFAULT_MAX_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--rate-limit",
+        type=_parse_rate_limit,
+        metavar="CALLS_PER_SECOND",
+        help="Most API calls to start per second, 0 for no limit "
+        f"(default: COMTRADE_RATE or {DEFAULT_RATE_LIMIT:g})",
+    )
+
     parser.add_argument(
         "--flow",
         type=str,
@@ -350,7 +859,18 @@ Examples:
         help="Trade flow direction (default: both)",
     )
 
-    parser.add_argument("--output", type=str, help="Output file path (CSV, JSON, or Excel format)")
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Output file path (CSV, JSON, Excel, Parquet, or Feather format)",
+    )
+
+    parser.add_argument(
+        "--compression",
+        choices=["none", "zstd", "snappy"],
+        default="zstd",
+        help="Compression for Parquet or Feather output (default: zstd; Feather has no snappy)",
+    )
 
     parser.add_argument(
         "--preview",
@@ -358,6 +878,32 @@ Examples:
         help="Use preview API (500 records max, no API key needed)",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the API instead of reusing cached responses",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Directory to cache API responses in (default: {DEFAULT_CACHE_DIR})",
+    )
+
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=RESPONSE_CACHE_TTL / (24 * 60 * 60),
+        help="Days a cached response is reused before querying the API again (default: 30)",
+    )
+
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Remove all cached API responses and exit",
+    )
+
     parser.add_argument(
         "--list-commodities",
         action="store_true",
@@ -375,9 +921,16 @@ Examples:
         print()
         return
 
+    # Clear the response cache if requested
+    if args.clear_cache:
+        with ComtradeQuery(api_key=args.api_key, cache_dir=args.cache_dir) as query:
+            removed = query.clear_disk_cache()
+        print(f"Removed {removed} cached responses from {args.cache_dir}")
+        return
+
     # Validate required arguments
-    if not args.commodity and not args.commodity_name:
-        parser.error("Must provide either --commodity or --commodity-name")
+    if not args.commodity and not args.commodity_name and not args.sweep_commodities:
+        parser.error("Must provide either --commodity, --commodity-name or --sweep-commodities")
 
     if not args.reporter:
         parser.error("--reporter is required")
@@ -385,15 +938,49 @@ Examples:
     if not args.partner:
         parser.error("--partner is required")
 
-    if not args.year:
-        parser.error("--year is required")
+    if not args.year and not args.sweep_years:
+        parser.error("--year or --sweep-years is required")
+
+    sweep = args.sweep_commodities or args.sweep_years is not None
+    if sweep:
+        if args.sweep_commodities:
+            commodity_codes = list(CMM_HS_CODES.values())
+        elif args.commodity:
+            commodity_codes = [args.commodity]
+        elif args.commodity_name in CMM_HS_CODES:
+            commodity_codes = [CMM_HS_CODES[args.commodity_name]]
+        else:
+            parser.error(
+                f"Unknown commodity: {args.commodity_name}. Available options: {_CMM_NAMES_JOINED}"
+            )
+        years = args.sweep_years or [args.year]
 
     # Initialize query object (API key only needed for non-preview queries)
-    query = ComtradeQuery(api_key=args.api_key)
+    query = ComtradeQuery(
+        api_key=args.api_key,
+        use_cache=not args.no_cache,
+        cache_dir=args.cache_dir,
+        cache_ttl=args.cache_ttl * 24 * 60 * 60,
+        rate_limit=args.rate_limit,
+    )
 
     # Execute query
     try:
-        if args.commodity_name:
+        if sweep:
+            # Commodities and years are batched into as few API calls as
+            # possible, which run on a thread pool
+            df = query.query_many(
+                [args.reporter],
+                [args.partner],
+                commodity_codes,
+                years,
+                trade_flow=args.flow,
+                preview=args.preview,
+                max_workers=args.max_workers,
+            )
+            if "cmdCode" in df:
+                df["commodity_name"] = df["cmdCode"].astype(str).map(HS_TO_CMM)
+        elif args.commodity_name:
             df = query.query_cmm_commodity(
                 commodity_name=args.commodity_name,
                 reporter=args.reporter,
@@ -426,7 +1013,8 @@ Examples:
 
         # Save to file if requested
         if args.output:
-            query.save_results(df, args.output)
+            compression = None if args.compression == "none" else args.compression
+            query.save_results(df, args.output, compression=compression)
             print(f"Results saved to: {args.output}")
 
     except Exception as e:
@@ -435,6 +1023,8 @@ Examples:
 
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        query.close()
 
 
 if __name__ == "__main__":